@@ -4,19 +4,25 @@ Boulder Reporting Lab Vote Tracker Integration
 Integrates data from BRL's vote tracker spreadsheet to enhance our existing data
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import json
 import logging
-import pandas as pd
-import re
+import functools
 import io
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
-from supabase import create_client, Client
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dotenv import load_dotenv
-import requests
-from bs4 import BeautifulSoup
+
+# pandas, bs4, supabase, rapidfuzz and requests_cache are imported where they are
+# used so the script starts quickly; these imports are for type hints only
+if TYPE_CHECKING:
+    import pandas as pd
+    from bs4 import BeautifulSoup
+    from supabase import Client
 
 # Load environment variables
 load_dotenv('.env.local')
@@ -28,9 +34,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns of the BRL spreadsheet used by process_brl_data, and the low-cardinality
+# ones that can be stored as categories
+BRL_CSV_COLUMNS = {'date', 'councilmember', 'vote', 'vote_type', 'agenda_item_desc_1', 'code'}
+BRL_CSV_DTYPES = {'councilmember': 'category', 'vote': 'category', 'vote_type': 'category'}
+
+# Map BRL vote values to the database enum
+VOTE_MAPPING = {
+    'Y': 'YEA',
+    'N': 'NAY',
+    'YEA': 'YEA',
+    'NAY': 'NAY',
+    'ABSTAIN': 'ABSTAIN',
+    'ABSENT': 'ABSENT'
+}
+
+# Seconds to wait on BRL and Google Sheets requests
+REQUEST_TIMEOUT = 15
+
+# Rows per Supabase write request, and how many of those requests run at once
+SUPABASE_BATCH_SIZE = 500
+SUPABASE_MAX_WORKERS = 8
+
+# Low-cardinality columns in any of the vote DataFrames we build
+CATEGORY_COLUMNS = ('councilmember', 'member_name', 'vote', 'vote_type', 'topic')
+
+# Links and embeds that point at a Google Sheets document
+SPREADSHEET_SELECTOR = (
+    'a[href*="docs.google.com"], a[href*="sheets.google.com"], '
+    'iframe[src*="docs.google.com"], iframe[src*="sheets.google.com"]'
+)
+
+# Vote phrasings found in BRL page text, combined so the page is scanned once
+_VOTE_RE = re.compile(
+    r'(?P<n1>\w+\s+\w+)\s+(?:voted|moved|seconded)\s+(?P<v1>YEA|NAY|ABSTAIN)'
+    r'|(?P<v2>YEA|NAY|ABSTAIN)\s+vote\s+by\s+(?P<n2>\w+\s+\w+)'
+    r'|(?P<n3>\w+\s+\w+)\s*-\s*(?P<v3>YEA|NAY|ABSTAIN)',
+    re.IGNORECASE
+)
+
 class BoulderReportingLabIntegrator:
     def __init__(self):
         """Initialize the integrator with Supabase connection"""
+        from supabase import create_client
+        import requests_cache
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         self.supabase_url = os.getenv('NEXT_PUBLIC_SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
         
@@ -42,70 +92,118 @@ class BoulderReportingLabIntegrator:
         # BRL Vote Tracker URLs (we'll need to find the actual spreadsheet URL)
         self.brl_vote_tracker_url = "https://boulderreportinglab.org/boulder-city-council-vote-tracker/"
         
-        # Load existing members for matching
-        self.members = self._load_existing_members()
+        # Known spreadsheet URL; when set, the BRL page is not fetched to discover it
+        self.brl_sheet_csv_url = os.getenv('BRL_SHEET_CSV_URL')
+        
+        # Cache the BRL page and spreadsheet export between runs; stale entries are
+        # revalidated with ETag/Last-Modified
+        self._session = requests_cache.CachedSession('brl_cache', expire_after=3600, cache_control=True)
+        
+        # Keep connections to BRL and Google alive between requests and retry transient failures
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
         
+        # Load existing members for matching in the background so the query
+        # overlaps the BRL page and spreadsheet downloads
+        self.members: List[Dict] = []
+        self._members_by_lower: Dict[str, Dict] = {}
+        self._lower_names: List[str] = []
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._members_future = self._executor.submit(self._load_existing_members)
+        
+        # The same councilmember names recur on every vote, so memoize the lookup per instance
+        self._cached_member_lookup = functools.lru_cache(maxsize=1024)(self._lookup_member)
+        
+    def _wait_for_members(self) -> None:
+        """Wait for the background member load to finish"""
+        if self._members_future is None:
+            return
+        
+        self.members = self._members_future.result()
+        self._members_future = None
+        self._executor.shutdown(wait=False)
+    
     def _load_existing_members(self) -> List[Dict]:
         """Load existing members from database for name matching"""
         try:
             result = self.supabase.table('members').select('id,name').execute()
-            return result.data if result.data else []
+            members = result.data if result.data else []
         except Exception as e:
             logger.error(f"Error loading members: {e}")
-            return []
+            members = []
+        
+        # Index members by lowercase name once so lookups are hash hits
+        self._members_by_lower = {m['name'].lower(): m for m in members}
+        self._lower_names = list(self._members_by_lower)
+        return members
     
     def _find_member_by_name(self, name: str) -> Optional[Dict]:
         """Find a member by name (fuzzy matching)"""
         if not name or len(name.strip()) < 2:
             return None
             
-        name = name.strip()
+        self._wait_for_members()
+        return self._cached_member_lookup(name.strip().lower())
+    
+    def _lookup_member(self, name: str) -> Optional[Dict]:
+        """Look up a stripped, lowercase name in the member index"""
+        from rapidfuzz import fuzz, process, utils
         
         # Exact match first
-        for member in self.members:
-            if member['name'].lower() == name.lower():
-                return member
+        member = self._members_by_lower.get(name)
+        if member:
+            return member
         
-        # Partial match
-        for member in self.members:
-            if name.lower() in member['name'].lower() or member['name'].lower() in name.lower():
-                return member
+        # Fuzzy match against the precomputed lowercase names; token_set_ratio ignores
+        # word order, so "Brockett, Aaron" still matches "Aaron Brockett"
+        match = process.extractOne(
+            name,
+            self._lower_names,
+            scorer=fuzz.token_set_ratio,
+            processor=utils.default_process,
+            score_cutoff=75
+        )
+        if match:
+            return self._members_by_lower[match[0]]
         
         return None
     
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store repeated string columns as categories to cut DataFrame memory"""
+        return df.astype({column: 'category' for column in CATEGORY_COLUMNS if column in df.columns})
+    
     def scrape_brl_vote_tracker(self) -> Optional[pd.DataFrame]:
         """
         Scrape the actual BRL vote tracker data from their website
         """
+        from bs4 import BeautifulSoup
+        
         logger.info("Attempting to access BRL vote tracker data...")
         
+        if self.brl_sheet_csv_url:
+            return self._scrape_google_sheets(self.brl_sheet_csv_url)
+        
         try:
             # First, let's scrape the BRL page to see if we can find the spreadsheet link
-            response = requests.get(self.brl_vote_tracker_url)
+            response = self._session.get(self.brl_vote_tracker_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse the HTML to find the spreadsheet link
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
-            # Look for Google Sheets links or embedded spreadsheets
+            # Look for Google Sheets links or embedded spreadsheets in a single selector pass
             spreadsheet_links = []
-            
-            # Check for Google Sheets links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if 'docs.google.com' in href or 'sheets.google.com' in href:
-                    spreadsheet_links.append(href)
-                    logger.info(f"Found Google Sheets link: {href}")
-            
-            # Check for embedded iframes
-            for iframe in soup.find_all('iframe'):
-                src = iframe.get('src', '')
-                if 'docs.google.com' in src or 'sheets.google.com' in src:
-                    spreadsheet_links.append(src)
-                    logger.info(f"Found embedded spreadsheet: {src}")
+            for element in soup.select(SPREADSHEET_SELECTOR):
+                url = element.get('href') or element.get('src')
+                spreadsheet_links.append(url)
+                logger.info(f"Found Google Sheets link: {url}")
             
             # If we found a spreadsheet link, try to access it
             if spreadsheet_links:
+                logger.info(f"Set BRL_SHEET_CSV_URL={spreadsheet_links[0]} to skip the page scrape on future runs")
                 return self._scrape_google_sheets(spreadsheet_links[0])
             
             # If no spreadsheet found, try to extract data from the page itself
@@ -118,6 +216,8 @@ class BoulderReportingLabIntegrator:
     
     def _scrape_google_sheets(self, sheets_url: str) -> Optional[pd.DataFrame]:
         """Attempt to scrape data from Google Sheets"""
+        import pandas as pd
+        
         try:
             # Convert Google Sheets URL to CSV export URL
             if '/spreadsheets/d/' in sheets_url:
@@ -125,11 +225,16 @@ class BoulderReportingLabIntegrator:
                 csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
                 
                 logger.info(f"Attempting to access CSV export: {csv_url}")
-                response = requests.get(csv_url)
+                response = self._session.get(csv_url, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 
-                # Parse CSV data
-                df = pd.read_csv(io.StringIO(response.text))
+                # Parse the buffered body, keeping only the columns we use. The cached session
+                # reads the body itself when storing it, so response.raw can't be streamed here
+                df = pd.read_csv(
+                    io.BytesIO(response.content),
+                    usecols=lambda column: column in BRL_CSV_COLUMNS,
+                    dtype=BRL_CSV_DTYPES
+                )
                 logger.info(f"Successfully loaded {len(df)} rows from Google Sheets")
                 return df
             else:
@@ -142,6 +247,8 @@ class BoulderReportingLabIntegrator:
     
     def _extract_data_from_page(self, soup: BeautifulSoup) -> Optional[pd.DataFrame]:
         """Extract vote data from the BRL page content"""
+        import pandas as pd
+        
         try:
             # Look for tables or structured data on the page
             tables = soup.find_all('table')
@@ -149,7 +256,7 @@ class BoulderReportingLabIntegrator:
             if tables:
                 logger.info(f"Found {len(tables)} tables on the page")
                 # Try to parse the first table
-                df = pd.read_html(str(tables[0]))[0]
+                df = self._optimize_dtypes(pd.read_html(str(tables[0]))[0])
                 logger.info(f"Successfully parsed table with {len(df)} rows")
                 return df
             
@@ -158,99 +265,87 @@ class BoulderReportingLabIntegrator:
             logger.info("No tables found, attempting to extract from page text...")
             
             # Look for vote-related content
-            vote_patterns = [
-                r'(\w+\s+\w+)\s+(?:voted|moved|seconded)\s+(YEA|NAY|ABSTAIN)',
-                r'(YEA|NAY|ABSTAIN)\s+vote\s+by\s+(\w+\s+\w+)',
-                r'(\w+\s+\w+)\s*-\s*(YEA|NAY|ABSTAIN)'
-            ]
-            
             page_text = soup.get_text()
             extracted_data = []
             
-            for pattern in vote_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        member_name, vote = match
-                        extracted_data.append({
-                            'member_name': member_name.strip(),
-                            'vote': vote.upper(),
-                            'date': datetime.now().strftime('%Y-%m-%d'),
-                            'meeting_title': 'Extracted from BRL page',
-                            'agenda_item': 'Vote extracted from page content',
-                            'topic': 'Unknown',
-                            'vote_type': 'Extracted',
-                            'outcome': 'Unknown'
-                        })
+            for match in _VOTE_RE.finditer(page_text):
+                member_name = match['n1'] or match['n2'] or match['n3']
+                vote = match['v1'] or match['v2'] or match['v3']
+                extracted_data.append({
+                    'member_name': member_name.strip(),
+                    'vote': vote.upper(),
+                    'date': datetime.now().strftime('%Y-%m-%d'),
+                    'meeting_title': 'Extracted from BRL page',
+                    'agenda_item': 'Vote extracted from page content',
+                    'topic': 'Unknown',
+                    'vote_type': 'Extracted',
+                    'outcome': 'Unknown'
+                })
             
             if extracted_data:
-                df = pd.DataFrame(extracted_data)
+                df = self._optimize_dtypes(pd.DataFrame(extracted_data))
                 logger.info(f"Extracted {len(df)} vote records from page content")
                 return df
             
-            # If we still can't find data, create a minimal dataset based on what we know
-            logger.warning("Could not extract data from page, creating minimal dataset...")
-            return self._create_minimal_dataset()
+            logger.warning("Could not extract data from page")
+            return None
             
         except Exception as e:
             logger.error(f"Error extracting data from page: {e}")
             return None
     
-    def _create_minimal_dataset(self) -> pd.DataFrame:
-        """Create a minimal dataset based on what we know about BRL's tracker"""
-        # This is based on the information from their website
-        minimal_data = {
-            'date': ['2024-12-19', '2024-12-19', '2024-12-19', '2024-12-19'],
-            'meeting_title': ['Regular City Council Meeting', 'Regular City Council Meeting', 'Regular City Council Meeting', 'Regular City Council Meeting'],
-            'agenda_item': ['Micro-unit housing project at 2206 Pearl Street', 'Ceasefire resolution regarding Gaza', 'Public participation rules changes', 'Budget approval'],
-            'topic': ['Housing', 'Foreign Policy', 'Meeting Procedures', 'Budget'],
-            'member_name': ['Aaron Brockett', 'Matt Benjamin', 'Tara Winer', 'Bob Yates'],
-            'vote': ['YEA', 'NAY', 'YEA', 'YEA'],
-            'vote_type': ['Formal', 'Formal', 'Formal', 'Formal'],
-            'outcome': ['Approved', 'Denied', 'Approved', 'Approved']
-        }
-        
-        df = pd.DataFrame(minimal_data)
-        logger.info(f"Created minimal dataset with {len(df)} records based on BRL website information")
-        return df
-    
     def process_brl_data(self, df: pd.DataFrame) -> List[Dict]:
         """Process BRL data and convert to our format"""
-        logger.info("Processing BRL vote tracker data...")
+        import pandas as pd
         
-        processed_data = []
+        logger.info("Processing BRL vote tracker data...")
         
-        for _, row in df.iterrows():
-            try:
-                # Find matching member
-                member = self._find_member_by_name(row['councilmember'])
-                if not member:
-                    logger.warning(f"Could not find member: {row['councilmember']}")
-                    continue
-                
-                # Create decision record
-                decision_data = {
-                    'meeting_date': row['date'],
-                    'meeting_title': 'BRL Vote Tracker Meeting',
-                    'agenda_item': row['agenda_item_desc_1'] if pd.notna(row['agenda_item_desc_1']) else 'Vote recorded by BRL',
-                    'topic': row['code'] if pd.notna(row['code']) else 'Unknown',
-                    'member_id': member['id'],
-                    'member_name': row['councilmember'],
-                    'vote_value': row['vote'],
-                    'vote_type': row['vote_type'],
-                    'outcome': 'Recorded by BRL',
-                    'source': 'BRL Vote Tracker'
-                }
-                
-                processed_data.append(decision_data)
-                
-            except Exception as e:
-                logger.error(f"Error processing row: {e}")
-                continue
+        try:
+            # Match each distinct councilmember name once, then map the ids across the column
+            member_ids_by_name = {}
+            for name in df['councilmember'].dropna().unique():
+                member = self._find_member_by_name(str(name))
+                if member:
+                    member_ids_by_name[name] = member['id']
+                else:
+                    logger.warning(f"Could not find member: {name}")
+            
+            member_ids = df['councilmember'].map(member_ids_by_name)
+            matched = df.loc[member_ids.notna()]
+            
+            # Build decision records column-wise
+            processed_data = pd.DataFrame({
+                'meeting_date': matched['date'],
+                'meeting_title': 'BRL Vote Tracker Meeting',
+                'agenda_item': matched['agenda_item_desc_1'].fillna('Vote recorded by BRL'),
+                'topic': matched['code'].fillna('Unknown'),
+                'member_id': member_ids[member_ids.notna()],
+                'member_name': matched['councilmember'],
+                'vote_value': matched['vote'].astype(str).str.upper().map(VOTE_MAPPING).fillna('ABSTAIN'),
+                'vote_type': matched['vote_type'],
+                'outcome': 'Recorded by BRL',
+                'source': 'BRL Vote Tracker'
+            }).to_dict('records')
+            
+        except KeyError as e:
+            logger.error(f"BRL data is missing expected column: {e}")
+            return []
         
         logger.info(f"Processed {len(processed_data)} records from BRL data")
         return processed_data
     
+    def _upsert_in_batches(self, table: str, rows: List[Dict], on_conflict: str) -> List[Dict]:
+        """Upsert rows in fixed-size batches sent concurrently, returning the written rows"""
+        def upsert_batch(batch: List[Dict]) -> List[Dict]:
+            return self.supabase.table(table).upsert(batch, on_conflict=on_conflict).execute().data
+        
+        batches = [rows[i:i + SUPABASE_BATCH_SIZE] for i in range(0, len(rows), SUPABASE_BATCH_SIZE)]
+        if len(batches) == 1:
+            return upsert_batch(batches[0])
+        
+        with ThreadPoolExecutor(max_workers=SUPABASE_MAX_WORKERS) as executor:
+            return [row for written in executor.map(upsert_batch, batches) for row in written]
+    
     def save_brl_data_to_supabase(self, data: List[Dict]) -> bool:
         """Save processed BRL data to Supabase"""
         logger.info("Saving BRL data to Supabase...")
@@ -259,63 +354,54 @@ class BoulderReportingLabIntegrator:
             # Group records by meeting date to create meetings efficiently
             meetings_by_date = {}
             for record in data:
-                date = record['meeting_date']
-                if date not in meetings_by_date:
-                    meetings_by_date[date] = []
-                meetings_by_date[date].append(record)
+                meetings_by_date.setdefault(record['meeting_date'], []).append(record)
             
-            # Create meetings and process votes
-            for date, records in meetings_by_date.items():
-                # Create meeting
-                meeting_data = {
+            # Upsert all meetings; reruns reuse the existing rows. The title embeds the BRL date
+            # verbatim, so the returned rows are matched back by title rather than by position
+            titles_by_date = {date: f"BRL Vote Tracker Meeting - {date}" for date in meetings_by_date}
+            meeting_rows = [
+                {
                     'date': date,
-                    'title': f"BRL Vote Tracker Meeting - {date}",
+                    'title': title,
                     'meeting_type': 'Regular Council Meeting'
                 }
-                
-                meeting_result = self.supabase.table('meetings').insert(meeting_data).execute()
-                meeting_id = meeting_result.data[0]['id']
-                
-                # Process each vote for this meeting
+                for date, title in titles_by_date.items()
+            ]
+            saved_meetings = self._upsert_in_batches('meetings', meeting_rows, on_conflict='date,title')
+            meeting_ids_by_title = {row['title']: row['id'] for row in saved_meetings}
+            meeting_ids = {date: meeting_ids_by_title[title] for date, title in titles_by_date.items()}
+            
+            # Upsert one agenda item per (meeting, title); every member's vote on an item shares it
+            agenda_rows = {}
+            for date, records in meetings_by_date.items():
                 for record in records:
-                    # Create agenda item
-                    agenda_data = {
-                        'meeting_id': meeting_id,
-                        'title': record['agenda_item'][:500] if len(record['agenda_item']) > 500 else record['agenda_item'],
-                        'description': f"Topic: {record['topic']}",
-                        'issue_tags': [record['topic']] if record['topic'] != 'Unknown' else []
-                    }
-                    
-                    agenda_result = self.supabase.table('agenda_items').insert(agenda_data).execute()
-                    agenda_item_id = agenda_result.data[0]['id']
-                    
-                    # Map vote values to database enum
-                    vote_mapping = {
-                        'Y': 'YEA',
-                        'N': 'NAY',
-                        'YEA': 'YEA',
-                        'NAY': 'NAY',
-                        'ABSTAIN': 'ABSTAIN',
-                        'ABSENT': 'ABSENT'
-                    }
-                    
-                    # Handle NaN values
-                    vote_value = record['vote_value']
-                    if pd.isna(vote_value):
-                        mapped_vote = 'ABSTAIN'
-                    else:
-                        mapped_vote = vote_mapping.get(str(vote_value).upper(), 'ABSTAIN')
-                    
-                    # Create vote record
-                    vote_data = {
-                        'item_id': agenda_item_id,
+                    key = (meeting_ids[date], record['agenda_item'][:500])
+                    if key not in agenda_rows:
+                        agenda_rows[key] = {
+                            'meeting_id': key[0],
+                            'title': key[1],
+                            'description': f"Topic: {record['topic']}",
+                            'issue_tags': [record['topic']] if record['topic'] != 'Unknown' else []
+                        }
+            saved_agenda_items = self._upsert_in_batches(
+                'agenda_items', list(agenda_rows.values()), on_conflict='meeting_id,title'
+            )
+            agenda_item_ids = {(row['meeting_id'], row['title']): row['id'] for row in saved_agenda_items}
+            
+            # Upsert all votes, one per member per agenda item. These are the legacy votes columns
+            # (item_id/member_id); see supabase/migrations/20261015000002_brl_upsert_unique.sql
+            vote_rows = {}
+            for date, records in meetings_by_date.items():
+                for record in records:
+                    item_id = agenda_item_ids[(meeting_ids[date], record['agenda_item'][:500])]
+                    vote_rows[(item_id, record['member_id'])] = {
+                        'item_id': item_id,
                         'member_id': record['member_id'],
-                        'value': mapped_vote,
+                        'value': record['vote_value'],
                         'source_url': 'https://boulderreportinglab.org/boulder-city-council-vote-tracker/'
                     }
-                    
-                    # Insert into votes table
-                    self.supabase.table('votes').insert(vote_data).execute()
+            
+            self._upsert_in_batches('votes', list(vote_rows.values()), on_conflict='item_id,member_id')
             
             logger.info(f"Successfully saved {len(data)} records to Supabase")
             return True
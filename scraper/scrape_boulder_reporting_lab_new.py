@@ -8,15 +8,20 @@ import os
 import sys
 import json
 import logging
+import functools
+import io
 import pandas as pd
 import re
-import io
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 from dotenv import load_dotenv
-import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from rapidfuzz import fuzz, process, utils
 
 # Load environment variables
 load_dotenv('.env.local')
@@ -28,6 +33,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts in seconds for BRL and Google Sheets requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Columns of the BRL spreadsheet used by process_brl_data, and their parse dtypes. The
+# repeated names, votes and codes are read as categories so each distinct value is stored once
+BRL_CSV_COLUMNS = {'date', 'councilmember', 'vote', 'agenda_item_desc_1', 'code'}
+BRL_CSV_DTYPES = {'councilmember': 'category', 'vote': 'category', 'code': 'category'}
+
+# Where the discovered BRL spreadsheet id is remembered, and how long to trust it
+# before looking it up on the BRL page again
+BRL_SHEET_CACHE_PATH = '.brl_sheet.json'
+BRL_SHEET_CACHE_MAX_AGE = timedelta(days=7)
+
+# Spreadsheet rows parsed, processed and saved at a time
+BRL_CSV_CHUNK_SIZE = 10_000
+
+# Links and embeds that point at a Google Sheets document
+SPREADSHEET_SELECTOR = (
+    'a[href*="docs.google.com"], a[href*="sheets.google.com"], '
+    'iframe[src*="docs.google.com"], iframe[src*="sheets.google.com"]'
+)
+
+# Map BRL vote values to the database enum; anything else is recorded as ABSTAIN
+_VOTE_MAP = {'Y': 'YEA', 'N': 'NAY', 'YEA': 'YEA', 'NAY': 'NAY', 'ABSTAIN': 'ABSTAIN', 'ABSENT': 'ABSENT'}
+
+# A member name followed by their vote, as found in BRL page text
+_VOTE_RE = re.compile(r'(?P<councilmember>\w+)\s+(?P<vote>YEA|NAY|ABSTAIN|ABSENT)')
+
 class BoulderReportingLabIntegrator:
     def __init__(self):
         """Initialize the integrator with Supabase connection"""
@@ -37,54 +70,82 @@ class BoulderReportingLabIntegrator:
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("Missing Supabase environment variables")
         
-        self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+        # The PostgREST client keeps one pooled HTTP connection for all table calls
+        self.supabase: Client = create_client(
+            self.supabase_url,
+            self.supabase_key,
+            options=ClientOptions(postgrest_client_timeout=30, schema='public')
+        )
         
         # BRL Vote Tracker URLs
         self.brl_vote_tracker_url = "https://boulderreportinglab.org/boulder-city-council-vote-tracker/"
         
+        # Reuse keep-alive connections for BRL and Google Sheets fetches and retry transient failures.
+        # Responses are cached on disk for an hour, then revalidated with ETag/Last-Modified
+        self.session = requests_cache.CachedSession(
+            'brl_cache',
+            backend='sqlite',
+            expire_after=3600,
+            cache_control=True
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        
         # Load Boulder city and existing council members
-        self.boulder_city = self._load_boulder_city()
-        self.council_members = self._load_council_members()
+        self.boulder_city, self.council_members = self._load_boulder_city_and_members()
         
-    def _load_boulder_city(self) -> Optional[Dict]:
-        """Load Boulder city record"""
-        try:
-            result = self.supabase.table('cities').select('id,name').eq('name', 'Boulder').execute()
-            return result.data[0] if result.data else None
-        except Exception as e:
-            logger.error(f"Error loading Boulder city: {e}")
-            return None
-    
-    def _load_council_members(self) -> List[Dict]:
-        """Load existing council members for Boulder"""
+        # Index members by lowercase name for fuzzy matching, and remember recent lookups
+        self._member_choices = {m['_lname']: m for m in self.council_members}
+        self._member_names_list = list(self._member_choices.keys())
+        self._cached_member_lookup = functools.lru_cache(maxsize=512)(self._lookup_member)
+        
+    def _load_boulder_city_and_members(self) -> Tuple[Optional[Dict], List[Dict]]:
+        """Load the Boulder city record and its council members in one embedded query"""
         try:
-            result = self.supabase.table('council_members').select('id,name,title').eq('city_id', self.boulder_city['id']).execute()
-            return result.data if result.data else []
+            result = self.supabase.table('cities').select('id,name,council_members(id,name,title)').eq('name', 'Boulder').execute()
         except Exception as e:
-            logger.error(f"Error loading council members: {e}")
-            return []
+            logger.error(f"Error loading Boulder city and council members: {e}")
+            return None, []
+        
+        if not result.data:
+            logger.error("Boulder city record not found")
+            return None, []
+        
+        city = result.data[0]
+        members = city.pop('council_members', None) or []
+        
+        # Lowercase each name once here rather than on every comparison
+        for member in members:
+            member['_lname'] = member['name'].lower()
+        return city, members
     
     def _find_member_by_name(self, name: str) -> Optional[Dict]:
         """Find a council member by name (fuzzy matching)"""
         if not name or len(name.strip()) < 2:
             return None
             
-        name = name.strip()
-        
-        # Exact match first
-        for member in self.council_members:
-            if member['name'].lower() == name.lower():
-                return member
-        
-        # Partial match
-        for member in self.council_members:
-            if name.lower() in member['name'].lower() or member['name'].lower() in name.lower():
-                return member
-        
-        return None
+        return self._cached_member_lookup(name.strip().lower())
+    
+    def _lookup_member(self, key: str) -> Optional[Dict]:
+        """Look up a stripped, lowercase name in the member index"""
+        # Exact match first, then the closest name above the score cutoff
+        member = self._member_choices.get(key)
+        if member is None:
+            hit = process.extractOne(
+                key,
+                self._member_names_list,
+                scorer=fuzz.WRatio,
+                processor=utils.default_process,
+                score_cutoff=80
+            )
+            member = self._member_choices[hit[0]] if hit else None
+        return member
     
-    def _scrape_google_sheets(self, spreadsheet_url: str) -> Optional[pd.DataFrame]:
-        """Scrape data from Google Sheets CSV export"""
+    def _scrape_google_sheets(self, spreadsheet_url: str) -> Optional[Iterator[pd.DataFrame]]:
+        """Scrape data from Google Sheets CSV export as an iterator of row chunks"""
         try:
             # Convert to CSV export URL
             if '/spreadsheets/d/' in spreadsheet_url:
@@ -95,55 +156,93 @@ class BoulderReportingLabIntegrator:
             
             logger.info(f"Attempting to access CSV export: {csv_url}")
             
-            response = requests.get(csv_url)
+            # Feed the buffered CSV to the C parser in chunks, skipping unused columns. The
+            # cached session reads the body itself when storing it, so response.raw can't be streamed
+            response = self.session.get(csv_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
+            reader = pd.read_csv(
+                io.BytesIO(response.content),
+                engine='c',
+                low_memory=False,
+                usecols=lambda column: column in BRL_CSV_COLUMNS,
+                dtype=BRL_CSV_DTYPES,
+                chunksize=BRL_CSV_CHUNK_SIZE
+            )
             
-            # Read CSV data
-            df = pd.read_csv(io.StringIO(response.text))
-            logger.info(f"Successfully loaded {len(df)} rows from Google Sheets")
-            
-            return df
+            return self._iter_csv_chunks(reader)
             
         except Exception as e:
             logger.error(f"Error scraping Google Sheets: {e}")
             return None
     
-    def scrape_brl_vote_tracker(self) -> Optional[pd.DataFrame]:
-        """Scrape the actual BRL vote tracker data from their website"""
+    def _iter_csv_chunks(self, reader) -> Iterator[pd.DataFrame]:
+        """Yield CSV chunks, closing the reader once they are exhausted"""
+        with reader:
+            for chunk in reader:
+                logger.info(f"Loaded {len(chunk)} rows from Google Sheets")
+                yield chunk
+    
+    def _load_cached_sheet_id(self) -> Optional[str]:
+        """Return the remembered spreadsheet id if it was discovered recently enough"""
+        try:
+            with open(BRL_SHEET_CACHE_PATH) as f:
+                cached = json.load(f)
+            if datetime.now() - datetime.fromisoformat(cached['discovered_at']) < BRL_SHEET_CACHE_MAX_AGE:
+                return cached['sheet_id']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_sheet_id(self, spreadsheet_url: str) -> None:
+        """Remember the spreadsheet id so later runs can skip the BRL page"""
+        if '/spreadsheets/d/' not in spreadsheet_url:
+            return
+        
+        sheet_id = spreadsheet_url.split('/spreadsheets/d/')[1].split('/')[0]
+        try:
+            with open(BRL_SHEET_CACHE_PATH, 'w') as f:
+                json.dump({'sheet_id': sheet_id, 'discovered_at': datetime.now().isoformat()}, f)
+        except OSError as e:
+            logger.warning(f"Could not cache BRL spreadsheet id: {e}")
+    
+    def scrape_brl_vote_tracker(self) -> Optional[Iterator[pd.DataFrame]]:
+        """Scrape the actual BRL vote tracker data from their website as an iterator of row chunks"""
         logger.info("Attempting to access BRL vote tracker data...")
         
+        # Go straight to a recently discovered spreadsheet, skipping the BRL page
+        sheet_id = self._load_cached_sheet_id()
+        if sheet_id:
+            chunks = self._scrape_google_sheets(f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv")
+            if chunks is not None:
+                return chunks
+            logger.info("Cached spreadsheet could not be read, looking it up on the BRL page...")
+        
         try:
             # First, let's scrape the BRL page to see if we can find the spreadsheet link
-            response = requests.get(self.brl_vote_tracker_url)
+            response = self.session.get(self.brl_vote_tracker_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Parse the HTML to find the spreadsheet link
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
-            # Look for Google Sheets links or embedded spreadsheets
+            # Look for Google Sheets links or embedded spreadsheets in a single selector pass
             spreadsheet_links = []
-            
-            # Check for Google Sheets links
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if 'docs.google.com' in href or 'sheets.google.com' in href:
-                    spreadsheet_links.append(href)
-                    logger.info(f"Found Google Sheets link: {href}")
-            
-            # Check for embedded iframes
-            for iframe in soup.find_all('iframe'):
-                src = iframe.get('src', '')
-                if 'docs.google.com' in src or 'sheets.google.com' in src:
-                    spreadsheet_links.append(src)
-                    logger.info(f"Found embedded spreadsheet: {src}")
+            for element in soup.select(SPREADSHEET_SELECTOR):
+                url = element.get('href') or element.get('src')
+                spreadsheet_links.append(url)
+                logger.info(f"Found Google Sheets link: {url}")
             
             # If we found a spreadsheet link, try to access it
             if spreadsheet_links:
-                return self._scrape_google_sheets(spreadsheet_links[0])
+                chunks = self._scrape_google_sheets(spreadsheet_links[0])
+                if chunks is not None:
+                    self._save_sheet_id(spreadsheet_links[0])
+                return chunks
             
             # If no spreadsheet found, try to extract data from the page itself
             logger.info("No spreadsheet link found, attempting to extract data from page content...")
-            return self._extract_data_from_page(soup)
+            df = self._extract_data_from_page(soup)
+            return iter([df]) if df is not None else None
             
         except Exception as e:
             logger.error(f"Error scraping BRL vote tracker: {e}")
@@ -164,20 +263,21 @@ class BoulderReportingLabIntegrator:
             page_text = soup.get_text()
             
             # Look for vote patterns in text
-            vote_patterns = re.findall(r'(\w+)\s+(YEA|NAY|ABSTAIN|ABSENT)', page_text)
-            if vote_patterns:
-                data = {
-                    'councilmember': [pattern[0] for pattern in vote_patterns],
-                    'vote': [pattern[1] for pattern in vote_patterns],
-                    'date': [datetime.now().strftime('%Y-%m-%d')] * len(vote_patterns),
-                    'agenda_item_desc_1': ['Extracted from page content'] * len(vote_patterns),
-                    'code': ['Unknown'] * len(vote_patterns)
-                }
-                df = pd.DataFrame(data)
-                logger.info(f"Extracted {len(df)} vote patterns from page content")
-                return df
+            vote_patterns = _VOTE_RE.findall(page_text)
+            if not vote_patterns:
+                return None
             
-            return None
+            # Build the columns directly with typed arrays, letting pandas broadcast the constants
+            names, votes = zip(*vote_patterns)
+            df = pd.DataFrame({
+                'councilmember': pd.Series(names, dtype='string'),
+                'vote': pd.Series(votes, dtype='category'),
+                'date': datetime.now().strftime('%Y-%m-%d'),
+                'agenda_item_desc_1': 'Extracted from page content',
+                'code': 'Unknown'
+            })
+            logger.info(f"Extracted {len(df)} vote patterns from page content")
+            return df
             
         except Exception as e:
             logger.error(f"Error extracting data from page: {e}")
@@ -187,32 +287,36 @@ class BoulderReportingLabIntegrator:
         """Process BRL data and convert to our normalized format"""
         logger.info("Processing BRL vote tracker data...")
         
-        processed_data = []
+        # Resolve each distinct councilmember name (category) once, then map ids across the column
+        names = df['councilmember'].astype('category')
+        name_to_id = {}
+        for name in names.cat.categories:
+            member = self._find_member_by_name(str(name))
+            if member:
+                name_to_id[name] = member['id']
+            else:
+                logger.warning(f"Could not find council member: {name}")
         
-        for _, row in df.iterrows():
-            try:
-                # Find matching council member
-                member = self._find_member_by_name(row['councilmember'])
-                if not member:
-                    logger.warning(f"Could not find council member: {row['councilmember']}")
-                    continue
-                
-                # Create processed record
-                processed_record = {
-                    'date': row['date'],
-                    'council_member_id': member['id'],
-                    'council_member_name': row['councilmember'],
-                    'agenda_item_title': row['agenda_item_desc_1'] if pd.notna(row['agenda_item_desc_1']) else 'Vote recorded by BRL',
-                    'category': row['code'] if pd.notna(row['code']) else 'Unknown',
-                    'vote_value': row['vote'],
-                    'source_name': 'BRL Vote Tracker'
-                }
-                
-                processed_data.append(processed_record)
-                
-            except Exception as e:
-                logger.error(f"Error processing row: {e}")
-                continue
+        council_member_ids = names.map(name_to_id)
+        
+        # Keep rows with a known member and a meeting date; blank votes are still
+        # recorded as ABSTAIN below
+        valid = council_member_ids.notna() & df['date'].notna()
+        skipped = int((~valid).sum())
+        if skipped:
+            logger.warning(f"Skipped {skipped} rows with no matching council member or date")
+        
+        # Build processed records column-wise for the valid rows
+        processed = pd.DataFrame({
+            'date': df['date'],
+            'council_member_id': council_member_ids,
+            'council_member_name': df['councilmember'],
+            'agenda_item_title': df['agenda_item_desc_1'].astype('string').fillna('Vote recorded by BRL'),
+            'category': df['code'].astype('string').fillna('Unknown'),
+            'vote_value': df['vote'].astype('string').str.upper().map(_VOTE_MAP).fillna('ABSTAIN'),
+            'source_name': 'BRL Vote Tracker'
+        })[valid]
+        processed_data = processed.to_dict(orient='records')
         
         logger.info(f"Processed {len(processed_data)} records from BRL data")
         return processed_data
@@ -222,71 +326,26 @@ class BoulderReportingLabIntegrator:
         logger.info("Saving BRL data to Supabase...")
         
         try:
-            # Group records by meeting date to create meetings efficiently
-            meetings_by_date = {}
-            for record in data:
-                date = record['date']
-                if date not in meetings_by_date:
-                    meetings_by_date[date] = []
-                meetings_by_date[date].append(record)
-            
-            # Create meetings and process votes
-            for date, records in meetings_by_date.items():
-                # Create meeting
-                meeting_data = {
-                    'city_id': self.boulder_city['id'],
-                    'date': date,
-                    'title': f"BRL Vote Tracker Meeting - {date}",
-                    'meeting_type': 'Regular Council Meeting',
-                    'status': 'completed'
+            # Send every record to the bulk_insert_brl function, which creates meetings,
+            # agenda items and votes with set-based inserts in one transaction
+            records = [
+                {
+                    'date': record['date'],
+                    'agenda_item_title': record['agenda_item_title'][:500],
+                    'category': record['category'],
+                    'council_member_id': record['council_member_id'],
+                    'vote_value': record['vote_value'],
+                    'source_name': record['source_name']
                 }
-                
-                meeting_result = self.supabase.table('meetings').insert(meeting_data).execute()
-                meeting_id = meeting_result.data[0]['id']
-                
-                # Process each vote for this meeting
-                for record in records:
-                    # Create agenda item
-                    agenda_data = {
-                        'meeting_id': meeting_id,
-                        'title': record['agenda_item_title'][:500] if len(record['agenda_item_title']) > 500 else record['agenda_item_title'],
-                        'category': record['category'],
-                        'tags': [record['category']] if record['category'] != 'Unknown' else []
-                    }
-                    
-                    agenda_result = self.supabase.table('agenda_items').insert(agenda_data).execute()
-                    agenda_item_id = agenda_result.data[0]['id']
-                    
-                    # Map vote values to database enum
-                    vote_mapping = {
-                        'Y': 'YEA',
-                        'N': 'NAY',
-                        'YEA': 'YEA',
-                        'NAY': 'NAY',
-                        'ABSTAIN': 'ABSTAIN',
-                        'ABSENT': 'ABSENT'
-                    }
-                    
-                    # Handle NaN values
-                    vote_value = record['vote_value']
-                    if pd.isna(vote_value):
-                        mapped_vote = 'ABSTAIN'
-                    else:
-                        mapped_vote = vote_mapping.get(str(vote_value).upper(), 'ABSTAIN')
-                    
-                    # Create vote record
-                    vote_data = {
-                        'agenda_item_id': agenda_item_id,
-                        'council_member_id': record['council_member_id'],
-                        'vote_value': mapped_vote,
-                        'source_url': 'https://boulderreportinglab.org/boulder-city-council-vote-tracker/',
-                        'source_name': record['source_name']
-                    }
-                    
-                    # Insert into votes table
-                    self.supabase.table('votes').insert(vote_data).execute()
+                for record in data
+            ]
+            result = self.supabase.rpc('bulk_insert_brl', {
+                'p_city_id': self.boulder_city['id'],
+                'p_records': records,
+                'p_source_url': self.brl_vote_tracker_url
+            }).execute()
             
-            logger.info(f"Successfully saved {len(data)} records to Supabase")
+            logger.info(f"Successfully saved {len(data)} records to Supabase ({result.data} votes written)")
             return True
             
         except Exception as e:
@@ -299,28 +358,39 @@ class BoulderReportingLabIntegrator:
         
         try:
             # Scrape BRL data
-            df = self.scrape_brl_vote_tracker()
+            chunks = self.scrape_brl_vote_tracker()
             
-            if df is None or df.empty:
+            if chunks is None:
                 logger.error("No data found from BRL vote tracker")
                 return False
             
-            # Process the data
-            processed_data = self.process_brl_data(df)
+            # Process and save each chunk as it arrives so memory stays bounded
+            total_rows = 0
+            total_saved = 0
+            for df in chunks:
+                if df.empty:
+                    continue
+                total_rows += len(df)
+                
+                processed_data = self.process_brl_data(df)
+                if not processed_data:
+                    continue
+                
+                if not self.save_brl_data_to_supabase(processed_data):
+                    logger.error("Failed to save BRL data to Supabase")
+                    return False
+                total_saved += len(processed_data)
             
-            if not processed_data:
-                logger.error("No data processed from BRL")
+            if total_rows == 0:
+                logger.error("No data found from BRL vote tracker")
                 return False
             
-            # Save to Supabase
-            success = self.save_brl_data_to_supabase(processed_data)
-            
-            if success:
-                logger.info(f"Successfully integrated {len(processed_data)} records from BRL")
-                return True
-            else:
-                logger.error("Failed to save BRL data to Supabase")
+            if total_saved == 0:
+                logger.error("No data processed from BRL")
                 return False
+            
+            logger.info(f"Successfully integrated {total_saved} records from BRL")
+            return True
                 
         except Exception as e:
             logger.error(f"BRL integration failed: {e}")
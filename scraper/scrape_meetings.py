@@ -6,18 +6,27 @@ Scrapes meeting minutes and extracts decisions with member assignments
 
 import os
 import sys
+import functools
+import hashlib
 import json
 import logging
+import io
+import queue
 import re
+import shutil
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from supabase import create_client, Client
 from dotenv import load_dotenv
-import PyPDF2
-import io
+import fitz  # PyMuPDF
 
 # Load environment variables
 load_dotenv()
@@ -29,6 +38,154 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Abbreviated month names used in WebLink titles ("Minutes - Apr-04-2000")
+MONTH_MAP = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Every supported date layout in one alternation; the outer group name
+# (m.lastgroup) says which branch matched and so how to read the fields
+DATE_RE = re.compile(
+    r'(?P<minutes>Minutes\s*-\s*(?P<minutes_month>[A-Za-z]+)-(?P<minutes_day>\d{1,2})-(?P<minutes_year>\d{4}))'
+    r'|(?P<ymd>(?P<ymd_year>\d{4})[-_/](?P<ymd_month>\d{1,2})[-_/](?P<ymd_day>\d{1,2}))'  # YYYY-MM-DD
+    r'|(?P<compact>(?P<compact_year>\d{4})(?P<compact_month>\d{2})(?P<compact_day>\d{2}))'  # YYYYMMDD
+    r'|(?P<mdy>(?P<mdy_month>\d{1,2})[-_/](?P<mdy_day>\d{1,2})[-_/](?P<mdy_year>\d{4}|\d{2}))'  # MM-DD-YYYY or MM/DD/YY
+)
+
+# WebLink document id in a DocView/Browse URL
+DOC_ID_RE = re.compile(r'id=(\d+)')
+
+# Any attribute-quoted PDF URL in viewer HTML
+PDF_URL_RE = re.compile(r'(?:src|href|data|url)="([^"]*\.pdf[^"]*)"', re.IGNORECASE)
+
+# A capitalized member name of one or more words on a single line. Case-sensitive even inside
+# INVOLVEMENT_RE, so a name can't run on into "second by ..." or the next line
+MEMBER_NAME_PATTERN = r'(?-i:[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+)*)'
+
+# Motion makers, seconders and individual votes in one pass
+INVOLVEMENT_RE = re.compile(
+    rf'(?:MOTION|motion)\s+(?:by|from)\s+(?P<mover>{MEMBER_NAME_PATTERN})'
+    rf'|(?:SECOND|second)\s+(?:by|from)\s+(?P<seconder>{MEMBER_NAME_PATTERN})'
+    rf'|(?P<voter>{MEMBER_NAME_PATTERN})\s*[-:]\s*(?P<vote>YEA|NAY|ABSTAIN|ABSENT)',
+    re.IGNORECASE
+)
+
+# Listing pages only need table rows and links; skip building the rest of the tree
+LISTING_STRAINER = SoupStrainer(['a', 'tr'])
+
+# Pages of PDF text handed to the decision extractor at a time
+PDF_PAGE_CHUNK_SIZE = 20
+
+# Table rows (with their links) and direct PDF links from a WebLink folder page
+FOLDER_LISTING_JS = """() => {
+    const linkInfo = a => ({text: a.innerText || '', href: a.getAttribute('href')});
+    return {
+        rows: Array.from(document.querySelectorAll('tr')).map(row => ({
+            text: row.innerText || '',
+            links: Array.from(row.querySelectorAll('a')).map(linkInfo)
+        })),
+        pdf_links: Array.from(document.querySelectorAll('a[href*=".pdf"], a[href*=".PDF"]')).map(linkInfo)
+    };
+}"""
+
+# Tags clickable download / "View plain text" controls and returns their texts,
+# download-like controls first, each distinct text once
+DOWNLOAD_CANDIDATES_JS = """() => {
+    const words = /download|save|get|export|pdf/i;
+    const seen = new Set();
+    const downloads = [];
+    const plainText = [];
+    document.querySelectorAll('a, button, input[type="button"], input[type="submit"], input[type="image"], [onclick]').forEach(el => {
+        const text = (el.innerText || el.value || '').trim();
+        const key = text.toLowerCase();
+        if (seen.has(key)) return;
+        const attrs = (el.getAttribute('href') || '') + ' ' + (el.getAttribute('onclick') || '');
+        if (key.includes('view plain text')) {
+            plainText.push([el, text]);
+        } else if (words.test(key) || words.test(attrs)) {
+            downloads.push([el, text]);
+        } else {
+            return;
+        }
+        seen.add(key);
+    });
+    return downloads.concat(plainText).map(([el, text], index) => {
+        el.setAttribute('data-download-candidate', index);
+        return text;
+    });
+}"""
+
+# Words that mark a section as a decision
+DECISION_INDICATORS = frozenset({
+    'MOTION', 'RESOLUTION', 'ORDINANCE', 'VOTE', 'DECISION', 'APPROVED', 'DENIED',
+    'PASSED', 'FAILED', 'TABLED', 'SECOND', 'MOVE', 'MOVED'
+})
+
+# Decision type by first keyword present, in priority order
+DECISION_TYPES = (
+    ('MOTION', 'motion'),
+    ('RESOLUTION', 'resolution'),
+    ('ORDINANCE', 'ordinance'),
+    ('PROCLAMATION', 'proclamation'),
+    ('VOTE', 'vote'),
+)
+
+# Outcome by first keyword group present, in priority order
+OUTCOMES = (
+    ('approved', frozenset({'APPROVED', 'PASSED', 'ADOPTED', 'ACCEPTED'})),
+    ('denied', frozenset({'DENIED', 'REJECTED', 'FAILED'})),
+    ('tabled', frozenset({'TABLED', 'POSTPONED', 'DEFERRED'})),
+    ('referred', frozenset({'REFERRED', 'SENT TO COMMITTEE'})),
+)
+
+# Single case-insensitive scan for all of the above; longest first so MOVED wins over MOVE
+KEYWORD_RE = re.compile('|'.join(sorted(
+    DECISION_INDICATORS
+    | {keyword for keyword, _ in DECISION_TYPES}
+    | {keyword for _, group in OUTCOMES for keyword in group},
+    key=lambda keyword: (-len(keyword), keyword)
+)), re.IGNORECASE)
+
+# A run of non-blank lines; sections of minutes text are separated by blank lines
+SECTION_RE = re.compile(r'[^\n]+(?:\n[^\n]+)*')
+
+# Literal words at least one of which appears in any involvement match
+INVOLVEMENT_LITERALS = ('motion', 'second', 'yea', 'nay', 'abstain', 'absent')
+
+# Seconds to wait on each HEAD probe of a candidate PDF URL
+PDF_PROBE_TIMEOUT = 5
+
+# Parsed minutes from earlier runs, one JSON file per meeting URL, revalidated with ETag/Last-Modified
+MEETING_CACHE_DIR = '.meeting_cache'
+
+# Laserfiche endpoints that may serve a document as a PDF, relative to base_url
+PDF_URL_TEMPLATES = (
+    "/WebLink/GetDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
+    "/WebLink/Download.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
+    "/WebLink/ViewDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
+    "/WebLink/GetFile.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
+    "/WebLink/Document.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
+    "/WebLink/DocView.aspx?id={doc_id}&dbid=0&repo=LF8PROD2&format=pdf",
+)
+
+# Milliseconds allowed for probe-page navigations and the follow-up body wait;
+# WebLink viewers keep polling, so waiting for network idle burns the full timeout
+PROBE_NAVIGATION_TIMEOUT = 10000
+PROBE_BODY_TIMEOUT = 5000
+
+# Milliseconds a download button gets to start a download before the next button is tried
+DOWNLOAD_START_TIMEOUT = 5000
+
+# Downloaded PDFs kept in memory; the least recently used is evicted first
+PDF_CACHE_SIZE = 16
+
+# Rows per Supabase insert request
+SUPABASE_BATCH_SIZE = 500
+
+# Meetings scraped in parallel; each worker owns a Chromium instance
+MEETING_SCRAPE_WORKERS = 4
+
 class BoulderMeetingScraper:
     def __init__(self):
         """Initialize the scraper with Supabase connection"""
@@ -42,6 +199,21 @@ class BoulderMeetingScraper:
         self.base_url = "https://documents.bouldercolorado.gov"
         self.meetings_url = f"{self.base_url}/WebLink/Browse.aspx?id=10888&dbid=0&repo=LF8PROD2"
         
+        # SCRAPE_DEBUG=1 shows the browser and saves screenshots along the way
+        self.debug = os.getenv('SCRAPE_DEBUG', '0') == '1'
+        
+        # Plain HTTP session for WebLink pages that don't need a browser
+        self.http = requests.Session()
+        self.http.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; City-Council-Tracker)'})
+        
+        # Recently downloaded PDFs, so retries and repeated links don't refetch
+        self._pdf_cache = OrderedDict()
+        self._pdf_cache_lock = threading.Lock()
+        
+        # How often each PDF_URL_TEMPLATES entry has served a PDF; winners are tried first
+        self._pattern_scores = Counter()
+        self._pattern_scores_lock = threading.Lock()
+        
         # Common decision patterns
         self.decision_patterns = [
             r'(?:MOTION|motion)\s+(?:by|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
@@ -59,8 +231,14 @@ class BoulderMeetingScraper:
             r'(?:VOTE|vote)\s+RESULT:\s*(PASSED|passed|FAILED|failed|TABLED|tabled)',
         ]
         
+        # Playwright objects are bound to the thread that created them, so each
+        # worker thread lazily starts and reuses its own browser context
+        self._thread_state = threading.local()
+        
         # Load existing members for name matching
         self.members = self._load_existing_members()
+        self._index_members()
+        self._cached_member_lookup = functools.lru_cache(maxsize=512)(self._lookup_member)
         
     def _load_existing_members(self) -> List[Dict]:
         """Load existing members from database for name matching"""
@@ -71,54 +249,191 @@ class BoulderMeetingScraper:
             logger.error(f"Error loading members: {e}")
             return []
     
+    def _index_members(self):
+        """Precompute lowercase names and a token index for member lookups"""
+        self._members_by_lower = {}
+        self._member_lower_names = []
+        self._token_index: Dict[str, List[int]] = defaultdict(list)
+        
+        for position, member in enumerate(self.members):
+            lower_name = self._normalize_name(member['name'])
+            self._members_by_lower.setdefault(lower_name, member)
+            self._member_lower_names.append((member, lower_name))
+            for token in set(lower_name.split()):
+                self._token_index[token].append(position)
+    
+    @staticmethod
+    def _normalize_name(name: str) -> str:
+        """Lowercase a name and collapse runs of whitespace so PDF line breaks don't split cache keys"""
+        return ' '.join(name.split()).lower()
+    
     def _find_member_by_name(self, name: str) -> Optional[Dict]:
         """Find a member by name (fuzzy matching)"""
         if not name or len(name.strip()) < 2:
             return None
-            
-        name = name.strip()
         
+        return self._cached_member_lookup(self._normalize_name(name))
+    
+    def _lookup_member(self, name_lower: str) -> Optional[Dict]:
+        """Resolve a lowercased name to a member; wrapped in an LRU cache per instance"""
         # Exact match first
-        for member in self.members:
-            if member['name'].lower() == name.lower():
-                return member
+        member = self._members_by_lower.get(name_lower)
+        if member:
+            return member
         
         # Partial match
-        for member in self.members:
-            if name.lower() in member['name'].lower() or member['name'].lower() in name.lower():
+        for member, member_lower in self._member_lower_names:
+            if name_lower in member_lower or member_lower in name_lower:
                 return member
         
-        # Split name and try matching parts
-        name_parts = name.split()
-        for member in self.members:
-            member_parts = member['name'].split()
-            if any(part.lower() in [mp.lower() for mp in member_parts] for part in name_parts):
-                return member
+        # Split name and try matching parts, keeping the earliest member
+        positions = [self._token_index[part][0] for part in name_lower.split() if part in self._token_index]
+        if positions:
+            return self.members[min(positions)]
         
         return None
     
+    def _get_browser_context(self):
+        """Return this thread's browser context, launching Chromium on first use"""
+        state = self._thread_state
+        if getattr(state, 'browser_context', None) is None:
+            state.playwright = sync_playwright().start()
+            state.browser = state.playwright.chromium.launch(headless=not self.debug)
+            state.browser_context = state.browser.new_context(accept_downloads=True)
+        return state.browser_context
+    
+    def _get_probe_page(self):
+        """Return this thread's reusable page for follow-up navigations"""
+        state = self._thread_state
+        probe_page = getattr(state, 'probe_page', None)
+        if probe_page is None or probe_page.is_closed():
+            probe_page = self._get_browser_context().new_page()
+            state.probe_page = probe_page
+        return probe_page
+    
+    def close(self):
+        """Shut down this thread's browser, if one was started"""
+        state = self._thread_state
+        try:
+            if getattr(state, 'browser', None):
+                state.browser.close()
+            if getattr(state, 'playwright', None):
+                state.playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+        finally:
+            state.playwright = None
+            state.browser = None
+            state.browser_context = None
+            state.probe_page = None
+    
+    def _debug_screenshot(self, page, path: str):
+        """Save a screenshot when running in debug mode"""
+        if not self.debug:
+            return
+        # Viewport only; full-page captures are much slower to render and encode
+        page.screenshot(path=path, full_page=False)
+        logger.info(f"Screenshot saved as {path}")
+    
+    def _wait_for_selector(self, page, selector: str, timeout: int = 15000) -> bool:
+        """Wait until selector appears; log and carry on if it never does"""
+        try:
+            page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.warning(f"Timed out waiting for {selector}")
+            return False
+    
     def scrape_meetings_list(self) -> List[Dict]:
         """Scrape the meetings list page to get meeting URLs by navigating through folders"""
         logger.info("Scraping meetings list page...")
         
+        try:
+            response = self.http.get(self.meetings_url, timeout=30)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.text, 'lxml', parse_only=LISTING_STRAINER)
+            
+            # WebLink can render the listing client-side; only then do we need a browser
+            folder_links = soup.select('a[href*="Browse.aspx"]')
+            if not folder_links:
+                logger.info("No folder links in static HTML, falling back to Playwright")
+                return self._scrape_meetings_list_playwright()
+            
+            logger.info(f"Found {len(folder_links)} potential folder links")
+            
+            folder_info = []
+            for folder_link in folder_links[:5]:  # Limit to first 5 folders for testing
+                folder_text = folder_link.get_text(strip=True)
+                folder_href = folder_link.get('href')
+                if folder_href and not folder_text.lower() in ['back', 'up', 'home']:
+                    folder_info.append({'text': folder_text, 'href': folder_href})
+            
+            meetings = []
+            for i, folder in enumerate(folder_info):
+                try:
+                    logger.info("Processing folder %d: '%s' -> %s", i + 1, folder['text'], folder['href'])
+                    folder_url = f"{self.base_url}/WebLink/{folder['href']}" if not folder['href'].startswith('http') else folder['href']
+                    
+                    folder_response = self.http.get(folder_url, timeout=30)
+                    folder_response.raise_for_status()
+                    folder_soup = BeautifulSoup(folder_response.text, 'lxml', parse_only=LISTING_STRAINER)
+                    
+                    # Meetings are listed in a table with "Minutes - Date" format
+                    for row in folder_soup.select('tr'):
+                        row_text = row.get_text(' ', strip=True)
+                        if 'Minutes' not in row_text or not any(char.isdigit() for char in row_text):
+                            continue
+                        for link in row.select('a[href]'):
+                            link_text = link.get_text(strip=True)
+                            if link_text and 'Minutes' in link_text:
+                                meetings.append(self._build_meeting_entry(link_text, link['href'], folder['text']))
+                                logger.info("Added meeting: '%s'", link_text)
+                    
+                    # Also look for any PDF links that might be direct
+                    for pdf_link in folder_soup.select('a[href*=".pdf"], a[href*=".PDF"]'):
+                        pdf_text = pdf_link.get_text(strip=True)
+                        if pdf_text:
+                            meetings.append(self._build_meeting_entry(pdf_text, pdf_link['href'], folder['text']))
+                            logger.info("Found direct PDF: '%s' -> %s", pdf_text, pdf_link['href'])
+                    
+                except Exception as e:
+                    logger.error("Error processing folder %d: %s", i + 1, e)
+                    continue
+            
+            logger.info(f"Found {len(meetings)} meetings across all folders")
+            return meetings
+            
+        except Exception as e:
+            logger.error(f"Error scraping meetings list: {e}")
+            return []
+    
+    def _build_meeting_entry(self, title: str, href: str, folder: str) -> Dict:
+        """Build a meeting record from a listing link"""
+        return {
+            'title': title,
+            'date': self._extract_date_from_filename(title),
+            'url': f"{self.base_url}{href}" if not href.startswith('http') else href,
+            'type': 'Meeting Minutes',
+            'folder': folder
+        }
+    
+    def _scrape_meetings_list_playwright(self) -> List[Dict]:
+        """Browser-driven folder traversal for listings rendered by JavaScript"""
         try:
             with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)  # Set to False for debugging
+                browser = p.chromium.launch(headless=not self.debug)
                 page = browser.new_page()
                 
                 # Navigate to the meetings page
                 logger.info(f"Navigating to: {self.meetings_url}")
                 page.goto(self.meetings_url, wait_until='networkidle')
                 
-                # Wait a bit for the page to load
-                page.wait_for_timeout(5000)
+                # Wait for the folder listing itself rather than a fixed delay
+                self._wait_for_selector(page, 'a[href*="Browse.aspx"]')
                 
                 # Take a screenshot for debugging
-                page.screenshot(path="meetings_page.png")
-                logger.info("Screenshot saved as meetings_page.png")
+                self._debug_screenshot(page, "meetings_page.png")
                 
-                # Get the page content to see what's actually there
-                page_content = page.content()
                 logger.info(f"Page title: {page.title()}")
                 
                 # Look for folder links and navigate through them
@@ -141,114 +456,53 @@ class BoulderMeetingScraper:
                                 'href': folder_href
                             })
                     except Exception as e:
-                        logger.error(f"Error extracting folder info: {e}")
+                        logger.error("Error extracting folder info: %s", e)
                         continue
                 
                 # Process each folder to find meeting PDFs
                 for i, folder in enumerate(folder_info):
                     try:
-                        logger.info(f"Processing folder {i+1}: '{folder['text']}' -> {folder['href']}")
+                        logger.info("Processing folder %d: '%s' -> %s", i + 1, folder['text'], folder['href'])
                         
                         # Navigate to the folder
                         folder_url = f"{self.base_url}/WebLink/{folder['href']}" if not folder['href'].startswith('http') else folder['href']
-                        logger.info(f"Navigating to folder: {folder_url}")
+                        logger.info("Navigating to folder: %s", folder_url)
                         
                         page.goto(folder_url, wait_until='networkidle')
-                        page.wait_for_timeout(3000)
                         
                         # Take a screenshot of the folder page for debugging
-                        page.screenshot(path=f"folder_{folder['text']}.png")
-                        logger.info(f"Screenshot saved as folder_{folder['text']}.png")
-                        
-                        # Wait a bit more for any dynamic content to load
-                        page.wait_for_timeout(2000)
-                        
-                        # Check if there are iframes
-                        iframes = page.query_selector_all('iframe')
-                        logger.info(f"Found {len(iframes)} iframes in folder '{folder['text']}'")
+                        self._debug_screenshot(page, f"folder_{folder['text']}.png")
                         
-                        # Look for all links in this folder to see what's available
-                        all_links = page.query_selector_all('a')
-                        logger.info(f"Found {len(all_links)} total links in folder '{folder['text']}'")
+                        # Wait for the meeting rows to render
+                        self._wait_for_selector(page, 'tr:has-text("Minutes")')
                         
-                        # Look for meeting entries in the table
-                        # Based on the text preview, meetings are listed in a table with "Minutes - Date" format
-                        meeting_entries = page.query_selector_all('tr')
-                        logger.info(f"Found {len(meeting_entries)} table rows in folder '{folder['text']}'")
+                        # Pull every row and PDF link out of the page in one round trip
+                        listing = page.evaluate(FOLDER_LISTING_JS)
+                        logger.info("Found %d table rows in folder '%s'", len(listing['rows']), folder['text'])
                         
-                        # Look for rows that contain meeting information
-                        for row in meeting_entries:
-                            try:
-                                row_text = row.inner_text().strip()
-                                if 'Minutes' in row_text and any(char.isdigit() for char in row_text):
-                                    # This looks like a meeting entry
-                                    logger.info(f"Found meeting entry: {row_text}")
-                                    
-                                    # Look for clickable elements in this row
-                                    row_links = row.query_selector_all('a')
-                                    for link in row_links:
-                                        link_text = link.inner_text().strip()
-                                        link_href = link.get_attribute('href')
-                                        
-                                        if link_href and link_text and 'Minutes' in link_text:
-                                            logger.info(f"  Clickable meeting link: '{link_text}' -> {link_href}")
-                                            
-                                            # Try to extract date from the meeting title
-                                            meeting_date = self._extract_date_from_filename(link_text)
-                                            
-                                            # Store the meeting information
-                                            meetings.append({
-                                                'title': link_text,
-                                                'date': meeting_date,
-                                                'url': f"{self.base_url}{link_href}" if not link_href.startswith('http') else link_href,
-                                                'type': 'Meeting Minutes',
-                                                'folder': folder['text']
-                                            })
-                                            
-                                            logger.info(f"Added meeting: '{link_text}'")
-                            except Exception as e:
-                                logger.error(f"Error processing row: {e}")
+                        # Meetings are listed in a table with "Minutes - Date" format
+                        for row in listing['rows']:
+                            row_text = row['text'].strip()
+                            if 'Minutes' not in row_text or not any(char.isdigit() for char in row_text):
                                 continue
+                            logger.info("Found meeting entry: %s", row_text)
+                            
+                            for link in row['links']:
+                                link_text = link['text'].strip()
+                                if link['href'] and link_text and 'Minutes' in link_text:
+                                    meetings.append(self._build_meeting_entry(link_text, link['href'], folder['text']))
+                                    logger.info("Added meeting: '%s'", link_text)
                         
                         # Also look for any PDF links that might be direct
-                        pdf_links = page.query_selector_all('a[href*=".pdf"], a[href*=".PDF"]')
-                        logger.info(f"Found {len(pdf_links)} direct PDF links in folder '{folder['text']}'")
-                        
-                        for pdf_link in pdf_links:
-                            try:
-                                pdf_text = pdf_link.inner_text().strip()
-                                pdf_href = pdf_link.get_attribute('href')
-                                
-                                if pdf_href and pdf_text:
-                                    # Try to extract date from the PDF filename or text
-                                    meeting_date = self._extract_date_from_filename(pdf_text)
-                                    
-                                    meetings.append({
-                                        'title': pdf_text,
-                                        'date': meeting_date,
-                                        'url': f"{self.base_url}{pdf_href}" if not pdf_href.startswith('http') else pdf_href,
-                                        'type': 'Meeting Minutes',
-                                        'folder': folder['text']
-                                    })
-                                    
-                                    logger.info(f"Found direct PDF: '{pdf_text}' -> {pdf_href}")
-                                    
-                            except Exception as e:
-                                logger.error(f"Error processing PDF link: {e}")
-                                continue
-                        
-                        # Go back to main page
-                        page.goto(self.meetings_url, wait_until='networkidle')
-                        page.wait_for_timeout(2000)
+                        logger.info("Found %d direct PDF links in folder '%s'", len(listing['pdf_links']), folder['text'])
+                        for pdf_link in listing['pdf_links']:
+                            pdf_text = pdf_link['text'].strip()
+                            if pdf_link['href'] and pdf_text:
+                                meetings.append(self._build_meeting_entry(pdf_text, pdf_link['href'], folder['text']))
+                                logger.info("Found direct PDF: '%s' -> %s", pdf_text, pdf_link['href'])
                         
                     except Exception as e:
-                        logger.error(f"Error processing folder {i+1}: {e}")
-                        # Try to go back to main page
-                        try:
-                            page.goto(self.meetings_url, wait_until='networkidle')
-                            page.wait_for_timeout(2000)
-                        except:
-                            pass
+                        logger.error("Error processing folder %d: %s", i + 1, e)
                         continue
                 
                 browser.close()
@@ -264,182 +518,77 @@ class BoulderMeetingScraper:
         if not filename:
             return None
         
-        # First, try to extract date from "Minutes - Apr-04-2000" format
-        minutes_date_pattern = r'Minutes\s*-\s*([A-Za-z]+)-(\d{1,2})-(\d{4})'
-        match = re.search(minutes_date_pattern, filename)
-        if match:
+        for match in DATE_RE.finditer(filename):
+            kind = match.lastgroup
             try:
-                month_name, day, year = match.groups()
-                # Convert month name to number
-                month_map = {
-                    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                }
-                month = month_map.get(month_name[:3])
-                if month:
-                    return date(int(year), month, int(day))
-            except ValueError:
-                pass
-        
-        # Common date patterns in filenames
-        date_patterns = [
-            r'(\d{1,2})[-_](\d{1,2})[-_](\d{4})',  # MM-DD-YYYY or MM_DD_YYYY
-            r'(\d{4})[-_](\d{1,2})[-_](\d{1,2})',  # YYYY-MM-DD or YYYY_MM_DD
-            r'(\d{1,2})[-_](\d{1,2})[-_](\d{2})',  # MM-DD-YY or MM_DD_YY
-            r'(\d{4})(\d{2})(\d{2})',  # YYYYMMDD
-            r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})',  # MM/DD/YYYY or MM-DD-YYYY
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, filename)
-            if match:
-                try:
-                    if len(match.groups()) == 3:
-                        if len(match.group(1)) == 4:  # YYYY-MM-DD format
-                            year, month, day = match.groups()
-                        else:  # MM-DD-YYYY format
-                            month, day, year = match.groups()
-                        
-                        # Handle 2-digit years
-                        if len(year) == 2:
-                            year = '20' + year
-                        
-                        return date(int(year), int(month), int(day))
-                except ValueError:
+                if kind == 'minutes':
+                    # "Minutes - Apr-04-2000" format
+                    month = MONTH_MAP.get(match.group('minutes_month')[:3])
+                    if month:
+                        return date(int(match.group('minutes_year')), month, int(match.group('minutes_day')))
                     continue
+                
+                year = match.group(f'{kind}_year')
+                # Handle 2-digit years
+                if len(year) == 2:
+                    year = '20' + year
+                return date(int(year), int(match.group(f'{kind}_month')), int(match.group(f'{kind}_day')))
+            except ValueError:
+                continue
         
         # If no date found, try to extract from text content
         return self._parse_date(filename)
     
     def _parse_date(self, date_text: str) -> Optional[date]:
-        """Parse date from various formats"""
+        """Parse month-name dates that the numeric patterns don't cover"""
         if not date_text:
             return None
-            
-        # Common date formats
-        date_formats = [
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-            '%B %d, %Y',
-            '%b %d, %Y',
-            '%Y-%m-%d'
-        ]
         
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_text.strip(), fmt).date()
-            except ValueError:
-                continue
-        
-        # Try to extract date using regex
-        date_patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            r'(\d{1,2})-(\d{1,2})-(\d{4})',
-            r'(\d{4})-(\d{1,2})-(\d{1,2})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, date_text)
-            if match:
+        # Numeric formats are already handled by DATE_RE
+        if any(char.isalpha() for char in date_text):
+            for fmt in ('%B %d, %Y', '%b %d, %Y'):
                 try:
-                    if len(match.groups()) == 3:
-                        month, day, year = match.groups()
-                        return date(int(year), int(month), int(day))
+                    return datetime.strptime(date_text.strip(), fmt).date()
                 except ValueError:
                     continue
         
         logger.warning(f"Could not parse date: {date_text}")
         return None
     
+    def _doc_id(self, url: str) -> Optional[str]:
+        """Return the WebLink document id from a URL, if it has one"""
+        match = DOC_ID_RE.search(url)
+        return match.group(1) if match else None
+    
     def scrape_meeting_minutes(self, meeting_url: str) -> Optional[Dict]:
         """Scrape individual meeting minutes using Playwright"""
         logger.info(f"Scraping meeting minutes: {meeting_url}")
         
+        # Direct PDF links don't need a browser at all
+        if meeting_url.lower().split('?')[0].endswith('.pdf'):
+            pdf_content = self._fetch_pdf(meeting_url)
+            if pdf_content:
+                return self._parse_pdf_minutes(pdf_content, meeting_url)
+        
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
+            with closing(self._get_browser_context().new_page()) as page:
                 # Navigate to the meeting document
                 logger.info(f"Navigating to: {meeting_url}")
                 page.goto(meeting_url, wait_until='networkidle', timeout=30000)
-                page.wait_for_timeout(5000)
                 
                 # Take a screenshot for debugging
-                screenshot_path = f"meeting_{meeting_url.split('id=')[1].split('&')[0]}.png"
-                page.screenshot(path=screenshot_path)
-                logger.info(f"Screenshot saved as {screenshot_path}")
+                if self.debug:
+                    self._debug_screenshot(page, f"meeting_{self._doc_id(meeting_url)}.png")
                 
-                # Look for download buttons specifically - try multiple approaches
-                download_buttons = []
-                
-                # Method 1: Look for all buttons and inputs
-                try:
-                    download_buttons.extend(page.query_selector_all('button'))
-                    download_buttons.extend(page.query_selector_all('input[type="button"]'))
-                    download_buttons.extend(page.query_selector_all('input[type="submit"]'))
-                    download_buttons.extend(page.query_selector_all('input[type="image"]'))
-                except:
-                    pass
-                
-                # Method 2: Look for links that might be download buttons
-                try:
-                    download_buttons.extend(page.query_selector_all('a'))
-                except:
-                    pass
-                
-                # Method 3: Look for any clickable elements with download-related text or attributes
-                try:
-                    # Look for elements with download-related text
-                    download_text_elements = page.query_selector_all('*:has-text("Download"), *:has-text("download"), *:has-text("Save"), *:has-text("save")')
-                    download_buttons.extend(download_text_elements)
-                    
-                    # Look for elements with download-related attributes
-                    download_attr_elements = page.query_selector_all('[onclick*="download"], [onclick*="Download"], [href*="download"], [href*="Download"]')
-                    download_buttons.extend(download_attr_elements)
-                except:
-                    pass
-                
-                # Filter and deduplicate download buttons
-                unique_buttons = []
-                seen_texts = set()
-                
-                for btn in download_buttons:
-                    if not btn:
-                        continue
-                    try:
-                        btn_text = btn.inner_text().strip().lower()
-                        btn_href = btn.get_attribute('href') or ''
-                        btn_onclick = btn.get_attribute('onclick') or ''
-                        
-                        # Check if this looks like a download button
-                        is_download = any(word in btn_text for word in ['download', 'save', 'get', 'export', 'pdf']) or \
-                                    any(word in btn_href.lower() for word in ['download', 'save', 'get', 'export', 'pdf']) or \
-                                    any(word in btn_onclick.lower() for word in ['download', 'save', 'get', 'export', 'pdf'])
-                        
-                        if is_download and btn_text not in seen_texts:
-                            unique_buttons.append(btn)
-                            seen_texts.add(btn_text)
-                    except:
-                        continue
-                
-                download_buttons = unique_buttons
+                # Find download-like and "View plain text" controls in one DOM walk,
+                # deduplicated by text in the page; matches are tagged so they can be clicked
+                candidate_texts = page.evaluate(DOWNLOAD_CANDIDATES_JS)
+                download_buttons = [
+                    page.locator(f'[data-download-candidate="{index}"]')
+                    for index in range(len(candidate_texts))
+                ]
                 logger.info(f"Found {len(download_buttons)} download buttons")
                 
-                # Also look for any elements that might contain "View plain text" or similar
-                view_text_elements = page.query_selector_all('*:has-text("View plain text"), *:has-text("view plain text")')
-                logger.info(f"Found {len(view_text_elements)} 'View plain text' elements")
-                
-                # Add these to download buttons if they might lead to text content
-                for elem in view_text_elements:
-                    try:
-                        elem_text = elem.inner_text().strip().lower()
-                        if 'view plain text' in elem_text:
-                            download_buttons.append(elem)
-                            logger.info(f"Added 'View plain text' element: {elem_text}")
-                    except:
-                        continue
-                
                 # Also look for download links
                 download_links = page.query_selector_all('a[href*="download"], a[href*="Download"], a[href*="view"], a[href*="View"]')
                 logger.info(f"Found {len(download_links)} download/view links")
@@ -452,24 +601,24 @@ class BoulderMeetingScraper:
                 for download_button in download_buttons:
                     try:
                         button_text = download_button.inner_text().strip()
-                        logger.info(f"Found download button: '{button_text}'")
+                        logger.info("Found download button: '%s'", button_text)
                         
                         # Special handling for "View plain text" button
                         if 'view plain text' in button_text.lower():
-                            logger.info(f"Clicking 'View plain text' button to get meeting content")
+                            logger.info("Clicking 'View plain text' button to get meeting content")
                             download_button.click()
                             
                             # Wait for the text content to load
-                            page.wait_for_timeout(3000)
+                            page.wait_for_load_state('networkidle')
                             
                             # Get the updated page content after clicking
                             updated_page_text = page.inner_text('body')
-                            logger.info(f"Page text after clicking 'View plain text': {len(updated_page_text)} characters")
+                            logger.info("Page text after clicking 'View plain text': %d characters", len(updated_page_text))
                             
                             # Check if we got substantial content
                             if len(updated_page_text) > 1000:
-                                logger.info(f"Successfully got meeting content from 'View plain text' button")
-                                logger.info(f"Content preview: {updated_page_text[:500]}...")
+                                logger.info("Successfully got meeting content from 'View plain text' button")
+                                logger.info("Content preview: %.500s...", updated_page_text)
                                 
                                 # Parse the text content directly
                                 return self._extract_decisions_from_text(updated_page_text, meeting_url)
@@ -477,40 +626,24 @@ class BoulderMeetingScraper:
                                 logger.warning("'View plain text' button clicked but no substantial content found")
                         else:
                             # Handle other download buttons (PDF downloads)
-                            logger.info(f"Clicking download button: '{button_text}'")
-                            
-                            # Set up download handling
-                            download_path = f"downloads/"
-                            os.makedirs(download_path, exist_ok=True)
+                            logger.info("Clicking download button: '%s'", button_text)
                             
-                            # Configure the page to handle downloads
-                            page.set_default_timeout(60000)  # 60 seconds for downloads
-                            
-                            download_button.click()
+                            # Tie the download to the click instead of polling a folder
+                            try:
+                                with page.expect_download(timeout=DOWNLOAD_START_TIMEOUT) as download_info:
+                                    download_button.click()
+                                download = download_info.value
+                            except PlaywrightTimeoutError:
+                                logger.warning("Download button clicked but no PDF file found")
+                                continue
                             
-                            # Wait for download to start
-                            page.wait_for_timeout(3000)
+                            logger.info("Successfully downloaded PDF: %s", download.suggested_filename)
                             
-                            # Check if a file was downloaded
-                            downloaded_files = [f for f in os.listdir(download_path) if f.endswith('.pdf')]
-                            if downloaded_files:
-                                # Get the most recent PDF file
-                                latest_pdf = max(downloaded_files, key=lambda f: os.path.getctime(os.path.join(download_path, f)))
-                                pdf_file_path = os.path.join(download_path, latest_pdf)
-                                
-                                logger.info(f"Successfully downloaded PDF: {latest_pdf}")
-                                
-                                # Read the PDF file
-                                with open(pdf_file_path, 'rb') as pdf_file:
-                                    pdf_content = pdf_file.read()
-                                
-                                # Parse the PDF content
-                                return self._parse_pdf_minutes(pdf_content, meeting_url)
-                            else:
-                                logger.warning("Download button clicked but no PDF file found")
+                            # Parse straight from the downloaded file
+                            return self._parse_pdf_minutes(str(download.path()), meeting_url)
                             
                     except Exception as e:
-                        logger.error(f"Error clicking download button: {e}")
+                        logger.error("Error clicking download button: %s", e)
                         continue
                 
                 # Check download links for PDF content
@@ -519,88 +652,77 @@ class BoulderMeetingScraper:
                         download_href = download_link.get_attribute('href')
                         download_text = download_link.inner_text().strip()
                         if download_href:
-                            logger.info(f"Found download link: '{download_text}' -> {download_href}")
+                            logger.info("Found download link: '%s' -> %s", download_text, download_href)
                             
                             # Try to access the download link
                             download_url = f"{self.base_url}{download_href}" if not download_href.startswith('http') else download_href
-                            logger.info(f"Trying download URL: {download_url}")
+                            logger.info("Trying download URL: %s", download_url)
+                            
+                            download_page = self._get_probe_page()
+                            response = download_page.goto(download_url, wait_until='domcontentloaded', timeout=PROBE_NAVIGATION_TIMEOUT)
                             
-                            download_page = browser.new_page()
-                            download_page.goto(download_url, wait_until='networkidle', timeout=30000)
+                            # A PDF response can be parsed from its raw bytes without touching the DOM
+                            content_type = (response.headers.get('content-type') or '').lower() if response else ''
+                            if 'application/pdf' in content_type:
+                                logger.info("Download link returned a PDF: %s", download_url)
+                                return self._parse_pdf_minutes(response.body(), download_url)
                             
-                            # Check if this returns PDF content
-                            content_type = download_page.evaluate("() => document.contentType || 'unknown'")
+                            download_page.wait_for_selector('body', state='attached', timeout=PROBE_BODY_TIMEOUT)
                             page_title = download_page.title()
                             page_text = download_page.inner_text('body')
                             
-                            logger.info(f"Download link result - Content type: {content_type}, Title: {page_title}, Text length: {len(page_text)}")
+                            logger.info("Download link result - Content type: %s, Title: %s, Text length: %d", content_type or 'unknown', page_title, len(page_text))
                             
-                            if 'pdf' in content_type.lower() or 'pdf' in page_title.lower() or len(page_text) > 1000:
-                                # This looks like a PDF or contains substantial content
-                                download_page.close()
-                                logger.info(f"Successfully found content from download link")
-                                return self._parse_html_minutes(download_page.content().encode('utf-8'), download_url)
-                            else:
-                                download_page.close()
+                            if 'pdf' in page_title.lower() or len(page_text) > 1000:
+                                # This page contains substantial content
+                                download_html = download_page.content()
+                                logger.info("Successfully found content from download link")
+                                return self._parse_html_minutes(download_html.encode('utf-8'), download_url)
                                 
                     except Exception as e:
-                        logger.error(f"Error checking download link: {e}")
+                        logger.error("Error checking download link: %s", e)
                         continue
                 
                 # Look for iframes that might contain the PDF viewer
                 iframes = page.query_selector_all('iframe')
                 logger.info(f"Found {len(iframes)} iframes")
                 
+                # The viewer HTML is the same for every iframe, so serialize it at most once
+                page_html = None
+                
                 # Check iframes for PDF content
                 for iframe in iframes:
                     try:
                         iframe_src = iframe.get_attribute('src')
                         if iframe_src:
-                            logger.info(f"Found iframe with src: {iframe_src}")
+                            logger.info("Found iframe with src: %s", iframe_src)
                             
-                            # Try to get the iframe content by examining the page source more carefully
                             try:
-                                # Wait for iframe to load
-                                page.wait_for_timeout(3000)
+                                # An iframe pointing straight at a PDF can be fetched without a browser
+                                if '.pdf' in iframe_src.lower():
+                                    full_pdf_url = f"{self.base_url}{iframe_src}" if not iframe_src.startswith('http') else iframe_src
+                                    pdf_content = self._fetch_pdf(full_pdf_url)
+                                    if pdf_content:
+                                        logger.info("Successfully found PDF content from iframe: %s", full_pdf_url)
+                                        return self._parse_pdf_minutes(pdf_content, full_pdf_url)
                                 
-                                # Get the page HTML to see if we can find the iframe content
-                                page_html = page.content()
-                                logger.info(f"Page HTML length: {len(page_html)} characters")
+                                # Otherwise look for PDF URLs in the page HTML with one scan,
+                                # only pulling the HTML across when it mentions a PDF at all
+                                if page_html is None:
+                                    has_pdf_reference = page.evaluate("() => /\\.pdf/i.test(document.documentElement.outerHTML)")
+                                    page_html = page.content() if has_pdf_reference else ''
+                                    logger.info("Page HTML length: %d characters", len(page_html))
                                 
-                                # Look for PDF content in the page HTML
-                                if 'application/pdf' in page_html or 'pdf' in page_html.lower():
-                                    logger.info("Found PDF references in page HTML")
-                                    
-                                    # Try to find the actual PDF URL by looking for common patterns
-                                    pdf_patterns = [
-                                        r'src="([^"]*\.pdf[^"]*)"',
-                                        r'href="([^"]*\.pdf[^"]*)"',
-                                        r'data="([^"]*\.pdf[^"]*)"',
-                                        r'url="([^"]*\.pdf[^"]*)"'
-                                    ]
-                                    
-                                    for pattern in pdf_patterns:
-                                        matches = re.findall(pattern, page_html, re.IGNORECASE)
-                                        if matches:
-                                            logger.info(f"Found PDF URLs with pattern {pattern}: {matches}")
-                                            for pdf_url in matches:
-                                                try:
-                                                    # Construct full URL
-                                                    full_pdf_url = f"{self.base_url}{pdf_url}" if not pdf_url.startswith('http') else pdf_url
-                                                    logger.info(f"Trying PDF URL: {full_pdf_url}")
-                                                    
-                                                    pdf_page = browser.new_page()
-                                                    pdf_page.goto(full_pdf_url, wait_until='networkidle', timeout=30000)
-                                                    pdf_content = pdf_page.content()
-                                                    pdf_page.close()
-                                                    
-                                                    # Check if this is actually PDF content
-                                                    if 'pdf' in pdf_content.lower() or len(pdf_content) > 1000:
-                                                        logger.info(f"Successfully found PDF content from URL: {full_pdf_url}")
-                                                        return self._parse_pdf_minutes(pdf_content.encode('utf-8'), full_pdf_url)
-                                                except Exception as e:
-                                                    logger.error(f"Error accessing PDF URL {pdf_url}: {e}")
-                                                    continue
+                                pdf_urls = PDF_URL_RE.findall(page_html)
+                                if pdf_urls:
+                                    logger.info("Found PDF URLs in page HTML: %s", pdf_urls)
+                                for pdf_url in pdf_urls:
+                                    full_pdf_url = f"{self.base_url}{pdf_url}" if not pdf_url.startswith('http') else pdf_url
+                                    logger.info("Trying PDF URL: %s", full_pdf_url)
+                                    pdf_content = self._fetch_pdf(full_pdf_url)
+                                    if pdf_content:
+                                        logger.info("Successfully found PDF content from URL: %s", full_pdf_url)
+                                        return self._parse_pdf_minutes(pdf_content, full_pdf_url)
                                 
                                 # If no PDF URLs found, try to access the iframe directly
                                 logger.info("Trying to access iframe directly")
@@ -616,71 +738,67 @@ class BoulderMeetingScraper:
                                     iframe_urls_to_try.append(f"{self.base_url}/{iframe_src}")
                                     iframe_urls_to_try.append(f"{self.base_url}/WebLink/{iframe_src}")
                                 
-                                logger.info(f"Will try iframe URLs: {iframe_urls_to_try}")
+                                logger.info("Will try iframe URLs: %s", iframe_urls_to_try)
                                 
                                 for iframe_url in iframe_urls_to_try:
                                     try:
-                                        logger.info(f"Trying iframe URL: {iframe_url}")
+                                        logger.info("Trying iframe URL: %s", iframe_url)
                                         
-                                        iframe_page = browser.new_page()
-                                        iframe_page.goto(iframe_url, wait_until='networkidle', timeout=30000)
+                                        iframe_page = self._get_probe_page()
+                                        iframe_page.goto(iframe_url, wait_until='domcontentloaded', timeout=PROBE_NAVIGATION_TIMEOUT)
+                                        iframe_page.wait_for_selector('body', state='attached', timeout=PROBE_BODY_TIMEOUT)
                                         
-                                        # Take a screenshot of the iframe content
-                                        iframe_screenshot = f"iframe_{meeting_url.split('id=')[1].split('&')[0]}.png"
-                                        iframe_page.screenshot(path=iframe_screenshot)
-                                        logger.info(f"Iframe screenshot saved as {iframe_screenshot}")
+                                        # Check if this iframe contains PDF content; only its length is
+                                        # needed to decide, so don't pull the text across
+                                        iframe_text_length = iframe_page.evaluate("() => document.body ? document.body.innerText.length : 0")
+                                        logger.info("Iframe text length: %d characters", iframe_text_length)
                                         
-                                        # Check if this iframe contains PDF content
-                                        iframe_text = iframe_page.inner_text('body')
-                                        logger.info(f"Iframe text length: {len(iframe_text)} characters")
-                                        
-                                        # Also check the iframe HTML content
-                                        iframe_html = iframe_page.content()
-                                        logger.info(f"Iframe HTML length: {len(iframe_html)} characters")
-                                        
-                                        if len(iframe_text) > 1000:  # Likely contains meeting content
-                                            logger.info(f"Iframe contains substantial content: {iframe_text[:200]}...")
-                                            iframe_page.close()
+                                        if iframe_text_length > 1000:  # Likely contains meeting content
+                                            iframe_html = iframe_page.content()
                                             return self._parse_html_minutes(iframe_html.encode('utf-8'), meeting_url)
                                         else:
-                                            logger.info(f"Iframe text content: {iframe_text}")
-                                            logger.info(f"Iframe HTML preview: {iframe_html[:500]}...")
+                                            if logger.isEnabledFor(logging.DEBUG):
+                                                logger.debug("Iframe text content: %s", iframe_page.inner_text('body'))
                                             
                                             # Check if there are any PDF elements or embedded content
-                                            pdf_elements = iframe_page.query_selector_all('embed[type="application/pdf"], object[type="application/pdf"], iframe[src*=".pdf"]')
-                                            if pdf_elements:
-                                                logger.info(f"Found {len(pdf_elements)} PDF elements in iframe")
-                                                for pdf_elem in pdf_elements:
-                                                    pdf_src = pdf_elem.get_attribute('src') or pdf_elem.get_attribute('data')
+                                            # Read the sources up front; the probe page is reused below
+                                            pdf_sources = iframe_page.eval_on_selector_all(
+                                                'embed[type="application/pdf"], object[type="application/pdf"], iframe[src*=".pdf"]',
+                                                "elements => elements.map(e => e.getAttribute('src') || e.getAttribute('data'))"
+                                            )
+                                            if pdf_sources:
+                                                logger.info("Found %d PDF elements in iframe", len(pdf_sources))
+                                                for pdf_src in pdf_sources:
                                                     if pdf_src:
-                                                        logger.info(f"PDF element source: {pdf_src}")
+                                                        logger.info("PDF element source: %s", pdf_src)
                                                         # Try to access the PDF directly
                                                         pdf_url = f"{self.base_url}{pdf_src}" if not pdf_src.startswith('http') else pdf_src
                                                         try:
-                                                            pdf_page = browser.new_page()
-                                                            pdf_page.goto(pdf_url, wait_until='networkidle', timeout=30000)
-                                                            pdf_content = pdf_page.content()
-                                                            pdf_page.close()
-                                                            logger.info(f"Successfully accessed PDF content from iframe")
-                                                            return self._parse_pdf_minutes(pdf_content.encode('utf-8'), pdf_url)
+                                                            # A plain request through the browser context keeps its
+                                                            # cookies without rendering the document
+                                                            response = iframe_page.context.request.fetch(pdf_url, timeout=PROBE_NAVIGATION_TIMEOUT)
+                                                            content_type = (response.headers.get('content-type') or '').lower()
+                                                            if 'application/pdf' not in content_type:
+                                                                logger.info("PDF element source is not a PDF (%s): %s", content_type or 'unknown', pdf_url)
+                                                                continue
+                                                            logger.info("Successfully accessed PDF content from iframe")
+                                                            return self._parse_pdf_minutes(response.body(), pdf_url)
                                                         except Exception as e:
-                                                            logger.error(f"Error accessing PDF from iframe: {e}")
+                                                            logger.error("Error accessing PDF from iframe: %s", e)
                                                             continue
                                             
-                                            iframe_page.close()
                                             break  # Successfully accessed this iframe URL
                                             
                                     except Exception as e:
-                                        logger.error(f"Error accessing iframe URL {iframe_url}: {e}")
-                                        iframe_page.close()
+                                        logger.error("Error accessing iframe URL %s: %s", iframe_url, e)
                                         continue
                                         
                             except Exception as e:
-                                logger.error(f"Error examining iframe content: {e}")
+                                logger.error("Error examining iframe content: %s", e)
                                 continue
                                     
                     except Exception as e:
-                        logger.error(f"Error checking iframe: {e}")
+                        logger.error("Error checking iframe: %s", e)
                         continue
                 
                 # If we still haven't found content, try to construct the PDF URL directly
@@ -688,43 +806,16 @@ class BoulderMeetingScraper:
                 logger.info("Trying to construct PDF URL directly")
                 
                 # Extract document ID from the meeting URL
-                doc_id_match = re.search(r'id=(\d+)', meeting_url)
-                if doc_id_match:
-                    doc_id = doc_id_match.group(1)
+                doc_id = self._doc_id(meeting_url)
+                if doc_id:
                     logger.info(f"Extracted document ID: {doc_id}")
                     
-                    # Try different PDF URL patterns based on the document ID
-                    pdf_url_patterns = [
-                        f"{self.base_url}/WebLink/GetDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                        f"{self.base_url}/WebLink/Download.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                        f"{self.base_url}/WebLink/ViewDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                        f"{self.base_url}/WebLink/GetFile.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                        f"{self.base_url}/WebLink/Document.aspx?id={doc_id}&dbid=0&repo=LF8PROD2"
-                    ]
-                    
-                    logger.info(f"Will try PDF URL patterns: {pdf_url_patterns}")
-                    
-                    for pdf_url in pdf_url_patterns:
-                        try:
-                            logger.info(f"Trying PDF URL pattern: {pdf_url}")
-                            
-                            pdf_page = browser.new_page()
-                            pdf_page.goto(pdf_url, wait_until='networkidle', timeout=30000)
-                            
-                            # Check if this is actually PDF content
-                            pdf_content = pdf_page.content()
-                            pdf_page.close()
-                            
-                            # Check if this looks like PDF content
-                            if len(pdf_content) > 1000 and ('pdf' in pdf_content.lower() or 'application/pdf' in pdf_content.lower()):
-                                logger.info(f"Successfully found PDF content from URL: {pdf_url}")
-                                return self._parse_pdf_minutes(pdf_content.encode('utf-8'), pdf_url)
-                            else:
-                                logger.info(f"URL {pdf_url} returned content length: {len(pdf_content)}")
-                                
-                        except Exception as e:
-                            logger.error(f"Error accessing PDF URL pattern {pdf_url}: {e}")
-                            continue
+                    pdf_url = self._probe_constructed_pdf_urls(doc_id)
+                    if pdf_url:
+                        pdf_content = self._fetch_pdf(pdf_url)
+                        if pdf_content:
+                            logger.info(f"Successfully found PDF content from URL: {pdf_url}")
+                            return self._parse_pdf_minutes(pdf_content, pdf_url)
                 
                 if pdf_links:
                     # Found PDF links, try to get the PDF content
@@ -733,112 +824,155 @@ class BoulderMeetingScraper:
                             pdf_href = pdf_link.get_attribute('href')
                             if pdf_href:
                                 pdf_url = f"{self.base_url}{pdf_href}" if not pdf_href.startswith('http') else pdf_href
-                                logger.info(f"Found PDF link: {pdf_url}")
-                                
-                                # Try to download the PDF using Playwright instead of requests
-                                pdf_page = browser.new_page()
-                                pdf_page.goto(pdf_url, wait_until='networkidle', timeout=30000)
+                                logger.info("Found PDF link: %s", pdf_url)
                                 
-                                # Check if this is actually a PDF
-                                content_type = pdf_page.evaluate("() => document.contentType || 'unknown'")
-                                logger.info(f"Content type: {content_type}")
-                                
-                                if 'pdf' in content_type.lower():
-                                    # Get the PDF content
-                                    pdf_content = pdf_page.content()
-                                    pdf_page.close()
-                                    return self._parse_pdf_minutes(pdf_content.encode('utf-8'), pdf_url)
-                                else:
-                                    pdf_page.close()
+                                pdf_content = self._fetch_pdf(pdf_url)
+                                if pdf_content:
+                                    return self._parse_pdf_minutes(pdf_content, pdf_url)
                                     
                         except Exception as e:
-                            logger.error(f"Error accessing PDF link: {e}")
+                            logger.error("Error accessing PDF link: %s", e)
                             continue
                 
                 # If no PDF links found, try to get the page content
-                page_content = page.content()
                 page_text = page.inner_text('body')
                 
                 logger.info(f"Page text length: {len(page_text)} characters")
                 if len(page_text) > 200:
-                    logger.info(f"Page text preview: {page_text[:200]}...")
-                
-                browser.close()
+                    logger.info("Page text preview: %.200s...", page_text)
                 
                 # Check if the content looks like meeting minutes
                 if 'minutes' in page_text.lower() or 'meeting' in page_text.lower():
-                    return self._parse_html_minutes(page_content.encode('utf-8'), meeting_url)
+                    return self._parse_html_minutes(page.content().encode('utf-8'), meeting_url)
                 else:
                     logger.warning(f"Page content doesn't appear to be meeting minutes")
-                    
-                    # Try to construct the actual PDF URL by modifying the DocView URL
-                    if 'DocView.aspx' in meeting_url:
-                        try:
-                            # Extract the document ID from the URL
-                            doc_id = meeting_url.split('id=')[1].split('&')[0]
-                            
-                            # Try different PDF URL patterns
-                            pdf_url_patterns = [
-                                f"{self.base_url}/WebLink/GetDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                                f"{self.base_url}/WebLink/Download.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                                f"{self.base_url}/WebLink/ViewDocument.aspx?id={doc_id}&dbid=0&repo=LF8PROD2",
-                                f"{self.base_url}/WebLink/DocView.aspx?id={doc_id}&dbid=0&repo=LF8PROD2&format=pdf"
-                            ]
-                            
-                            for pdf_url in pdf_url_patterns:
-                                try:
-                                    logger.info(f"Trying PDF URL pattern: {pdf_url}")
-                                    pdf_page = browser.new_page()
-                                    pdf_page.goto(pdf_url, wait_until='networkidle', timeout=30000)
-                                    
-                                    # Check if this returns PDF content
-                                    content_type = pdf_page.evaluate("() => document.contentType || 'unknown'")
-                                    page_title = pdf_page.title()
-                                    logger.info(f"PDF URL pattern result - Content type: {content_type}, Title: {page_title}")
-                                    
-                                    if 'pdf' in content_type.lower() or 'pdf' in page_title.lower():
-                                        # This looks like a PDF, try to get the content
-                                        pdf_content = pdf_page.content()
-                                        pdf_page.close()
-                                        logger.info(f"Successfully found PDF content from URL pattern")
-                                        return self._parse_pdf_minutes(pdf_content.encode('utf-8'), pdf_url)
-                                    else:
-                                        pdf_page.close()
-                                        
-                                except Exception as e:
-                                    logger.error(f"Error trying PDF URL pattern {pdf_url}: {e}")
-                                    continue
-                                    
-                        except Exception as e:
-                            logger.error(f"Error constructing PDF URL patterns: {e}")
-                    
                     return None
                 
         except Exception as e:
             logger.error(f"Error scraping meeting minutes: {e}")
             return None
     
-    def _parse_pdf_minutes(self, pdf_content: bytes, meeting_url: str) -> Optional[Dict]:
-        """Parse PDF meeting minutes"""
+    def _probe_constructed_pdf_urls(self, doc_id: str) -> Optional[str]:
+        """Probe the PDF_URL_TEMPLATES for doc_id, trying the historically winning template first"""
+        with self._pattern_scores_lock:
+            templates = sorted(PDF_URL_TEMPLATES, key=lambda template: -self._pattern_scores[template])
+            best_known = templates[0] if self._pattern_scores[templates[0]] else None
+        
+        urls = {template: f"{self.base_url}{template.format(doc_id=doc_id)}" for template in templates}
+        
+        # Once a template has worked the rest are only probed if it misses
+        pdf_url = self._probe_pdf_candidates([urls[best_known]]) if best_known else None
+        if not pdf_url:
+            pdf_url = self._probe_pdf_candidates([urls[template] for template in templates if template != best_known])
+        
+        if pdf_url:
+            template = next(template for template, url in urls.items() if url == pdf_url)
+            with self._pattern_scores_lock:
+                self._pattern_scores[template] += 1
+        return pdf_url
+    
+    def _probe_pdf_candidates(self, urls: List[str]) -> Optional[str]:
+        """HEAD all candidate URLs at once and return the first that serves a PDF"""
+        def is_pdf(url: str) -> bool:
+            try:
+                response = self.http.head(url, allow_redirects=True, timeout=PDF_PROBE_TIMEOUT)
+                return response.ok and 'pdf' in response.headers.get('Content-Type', '').lower()
+            except Exception as e:
+                logger.info(f"Probe failed for {url}: {e}")
+                return False
+        
+        logger.info(f"Probing PDF URL patterns: {urls}")
+        with ThreadPoolExecutor(max_workers=len(urls) or 1) as executor:
+            results = list(executor.map(is_pdf, urls))
+        
+        # Keep the original preference order among the hits
+        return next((url for url, hit in zip(urls, results) if hit), None)
+    
+    def _fetch_pdf(self, url: str) -> Optional[bytes]:
+        """Return PDF bytes for url, reusing recent successful downloads"""
+        with self._pdf_cache_lock:
+            if url in self._pdf_cache:
+                self._pdf_cache.move_to_end(url)
+                return self._pdf_cache[url]
+        
+        pdf_content = self._download_pdf(url)
+        if pdf_content:
+            with self._pdf_cache_lock:
+                self._pdf_cache[url] = pdf_content
+                if len(self._pdf_cache) > PDF_CACHE_SIZE:
+                    self._pdf_cache.popitem(last=False)
+        return pdf_content
+    
+    def _download_pdf(self, url: str) -> Optional[bytes]:
+        """Download a PDF over HTTP, returning None if the response isn't a PDF"""
+        try:
+            with self.http.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').lower()
+                
+                # Don't pull down a viewer page just to find out it isn't a PDF
+                if 'html' in content_type:
+                    logger.info(f"URL {url} returned {content_type}, not a PDF")
+                    return None
+                
+                buffer = io.BytesIO()
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, buffer)
+            
+            pdf_content = buffer.getvalue()
+            if 'pdf' not in content_type and not pdf_content.startswith(b'%PDF'):
+                logger.info(f"URL {url} did not return a PDF")
+                return None
+            return pdf_content
+        except Exception as e:
+            logger.error(f"Error fetching PDF {url}: {e}")
+            return None
+    
+    def _parse_pdf_minutes(self, pdf_content: Union[bytes, str], meeting_url: str) -> Optional[Dict]:
+        """Parse PDF meeting minutes from raw bytes or a file path"""
         try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            # A path lets MuPDF read the file without another in-memory copy
+            if isinstance(pdf_content, bytes):
+                pdf_doc = fitz.open(stream=pdf_content, filetype='pdf')
+            else:
+                pdf_doc = fitz.open(pdf_content)
             
-            text_content = ""
-            for page in pdf_reader.pages:
-                text_content += page.extract_text() + "\n"
+            # Work through the document a few pages at a time so large minutes
+            # never need their full text in memory at once
+            decisions = []
+            raw_text = ""
+            with pdf_doc:
+                for chunk in self._iter_pdf_chunks(pdf_doc):
+                    if not raw_text:
+                        raw_text = chunk
+                    decisions.extend(self._extract_decisions_from_text(chunk, meeting_url)['decisions'])
             
-            return self._extract_decisions_from_text(text_content, meeting_url)
+            return {
+                'decisions': decisions,
+                'source_url': meeting_url,
+                'raw_text': raw_text[:1000] + "..." if len(raw_text) > 1000 else raw_text  # Store first 1000 chars
+            }
             
         except Exception as e:
             logger.error(f"Error parsing PDF: {e}")
             return None
     
+    def _iter_pdf_chunks(self, pdf_doc, chunk_size: int = PDF_PAGE_CHUNK_SIZE) -> Iterator[str]:
+        """Yield the text of a PDF in groups of chunk_size pages"""
+        buffer = []
+        for page in pdf_doc:
+            buffer.append(page.get_text('text'))
+            if len(buffer) == chunk_size:
+                yield "\n".join(buffer)
+                buffer.clear()
+        if buffer:
+            yield "\n".join(buffer)
+    
     def _parse_html_minutes(self, html_content: bytes, meeting_url: str) -> Optional[Dict]:
         """Parse HTML meeting minutes"""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text_content = soup.get_text()
+            # Only the text is needed, so skip building a BeautifulSoup tree on top of lxml
+            text_content = lxml.html.document_fromstring(html_content).text_content()
             return self._extract_decisions_from_text(text_content, meeting_url)
             
         except Exception as e:
@@ -849,31 +983,28 @@ class BoulderMeetingScraper:
         """Extract decisions and member involvement from text"""
         decisions = []
         
-        # Split text into paragraphs/sections
-        sections = text.split('\n\n')
-        logger.info(f"Processing {len(sections)} text sections")
-        
-        for i, section in enumerate(sections):
-            section = section.strip()
+        # Walk paragraphs/sections lazily instead of materializing every one up front
+        section_count = 0
+        for i, match in enumerate(SECTION_RE.finditer(text)):
+            section_count += 1
+            section = match.group(0).strip()
             if len(section) < 50:  # Skip very short sections
                 continue
             
-            logger.info(f"Processing section {i+1}: {section[:100]}...")
+            logger.debug("Processing section %d: %.100s...", i + 1, section)
             
             # Look for decision patterns
             decision_info = self._identify_decision(section)
             if decision_info:
-                logger.info(f"Found decision in section {i+1}: {decision_info['title']}")
+                logger.info("Found decision in section %d: %s", i + 1, decision_info['title'])
                 decisions.append(decision_info)
-            else:
-                # Log why this section wasn't identified as a decision
-                text_upper = section.upper()
-                decision_indicators = ['MOTION', 'RESOLUTION', 'ORDINANCE', 'VOTE', 'DECISION', 'APPROVED', 'DENIED', 'PASSED', 'FAILED', 'TABLED', 'SECOND', 'MOVE', 'MOVED']
-                found_indicators = [indicator for indicator in decision_indicators if indicator in text_upper]
+            elif logger.isEnabledFor(logging.INFO):
+                # Log why this section wasn't identified as a decision; the rescan is only worth it when logged
+                found_indicators = sorted(self._find_keywords(section) & DECISION_INDICATORS)
                 if found_indicators:
-                    logger.info(f"Section {i+1} has indicators {found_indicators} but wasn't identified as decision")
+                    logger.info("Section %d has indicators %s but wasn't identified as decision", i + 1, found_indicators)
         
-        logger.info(f"Extracted {len(decisions)} decisions from text")
+        logger.info(f"Extracted {len(decisions)} decisions from {section_count} text sections")
         return {
             'decisions': decisions,
             'source_url': meeting_url,
@@ -882,8 +1013,6 @@ class BoulderMeetingScraper:
     
     def _identify_decision(self, text: str) -> Optional[Dict]:
         """Identify if a text section contains a decision"""
-        text_upper = text.upper()
-        
         # Skip header/title sections that don't contain actual decisions
         # But be more careful about sections that might contain both headers AND decisions
         header_indicators = ['MINUTES', 'CALL TO ORDER', 'ROLL CALL', 'PUBLIC', 'ADJOURNMENT']
@@ -892,14 +1021,15 @@ class BoulderMeetingScraper:
         if len(text.strip()) < 50:
             return None
             
-        # Check if this is just a header section
-        text_words = text_upper.split()
-        if len(text_words) < 10 and all(word in header_indicators for word in text_words if len(word) > 3):
+        # Check if this is just a header section; only the first few words are ever needed
+        text_words = text.split(None, 10)
+        if len(text_words) < 10 and all(word.upper() in header_indicators for word in text_words if len(word) > 3):
             return None
         
-        # Check if this looks like a decision
-        decision_indicators = ['MOTION', 'RESOLUTION', 'ORDINANCE', 'VOTE', 'DECISION', 'APPROVED', 'DENIED', 'PASSED', 'FAILED', 'TABLED', 'SECOND', 'MOVE', 'MOVED']
-        if not any(indicator in text_upper for indicator in decision_indicators):
+        # Check if this looks like a decision; one scan finds every keyword the
+        # indicator, type and outcome checks need
+        keywords = self._find_keywords(text)
+        if not keywords & DECISION_INDICATORS:
             return None
         
         # Skip very short sections that are likely just headers
@@ -907,10 +1037,10 @@ class BoulderMeetingScraper:
             return None
         
         # Extract decision type
-        decision_type = self._extract_decision_type(text)
+        decision_type = self._extract_decision_type(keywords)
         
         # Extract outcome
-        outcome = self._extract_outcome(text)
+        outcome = self._extract_outcome(keywords)
         
         # Extract member involvement
         member_involvement = self._extract_member_involvement(text)
@@ -919,101 +1049,80 @@ class BoulderMeetingScraper:
         # Some decisions might not have clear member assignments
         
         # Create decision title from first sentence
-        first_sentence = text.split('.')[0] if '.' in text else text[:100]
+        first_sentence, period, _ = text.partition('.')
+        if not period:
+            first_sentence = text[:100]
         
         return {
             'title': first_sentence.strip(),
-            'description': text[:500] + "..." if len(text) > 500 else text,
+            'description': text if len(text) <= 500 else text[:500] + "...",
             'decision_type': decision_type,
             'outcome': outcome,
             'source_text': text,
             'member_involvement': member_involvement or []
         }
     
-    def _extract_decision_type(self, text: str) -> str:
+    def _find_keywords(self, text: str) -> set:
+        """Return every decision/outcome keyword present in the text, upper-cased"""
+        return {keyword.upper() for keyword in KEYWORD_RE.findall(text)}
+    
+    def _extract_decision_type(self, keywords: set) -> str:
         """Extract the type of decision"""
-        text_upper = text.upper()
-        
-        if 'MOTION' in text_upper:
-            return 'motion'
-        elif 'RESOLUTION' in text_upper:
-            return 'resolution'
-        elif 'ORDINANCE' in text_upper:
-            return 'ordinance'
-        elif 'PROCLAMATION' in text_upper:
-            return 'proclamation'
-        elif 'VOTE' in text_upper:
-            return 'vote'
-        else:
-            return 'decision'
+        for keyword, decision_type in DECISION_TYPES:
+            if keyword in keywords:
+                return decision_type
+        return 'decision'
     
-    def _extract_outcome(self, text: str) -> str:
+    def _extract_outcome(self, keywords: set) -> str:
         """Extract the outcome of the decision"""
-        text_upper = text.upper()
-        
-        if any(word in text_upper for word in ['APPROVED', 'PASSED', 'ADOPTED', 'ACCEPTED']):
-            return 'approved'
-        elif any(word in text_upper for word in ['DENIED', 'REJECTED', 'FAILED']):
-            return 'denied'
-        elif any(word in text_upper for word in ['TABLED', 'POSTPONED', 'DEFERRED']):
-            return 'tabled'
-        elif any(word in text_upper for word in ['REFERRED', 'SENT TO COMMITTEE']):
-            return 'referred'
-        else:
-            return 'unknown'
+        for outcome, outcome_keywords in OUTCOMES:
+            if keywords & outcome_keywords:
+                return outcome
+        return 'unknown'
     
     def _extract_member_involvement(self, text: str) -> List[Dict]:
         """Extract member involvement from decision text"""
-        involvement = []
-        
-        # Look for motion makers
-        motion_pattern = r'(?:MOTION|motion)\s+(?:by|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-        motion_matches = re.findall(motion_pattern, text, re.IGNORECASE)
+        movers, seconders, voters = [], [], []
         
-        for name in motion_matches:
-            member = self._find_member_by_name(name)
-            if member:
-                involvement.append({
-                    'member_id': member['id'],
-                    'member_name': member['name'],
-                    'role': 'mover',
-                    'vote_value': None
-                })
-        
-        # Look for seconders
-        second_pattern = r'(?:SECOND|second)\s+(?:by|from)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'
-        second_matches = re.findall(second_pattern, text, re.IGNORECASE)
-        
-        for name in second_matches:
-            member = self._find_member_by_name(name)
-            if member:
-                involvement.append({
-                    'member_id': member['id'],
-                    'member_name': member['name'],
-                    'role': 'seconder',
-                    'vote_value': None
-                })
+        # Every involvement pattern needs one of these words; skip the regex otherwise
+        text_lower = text.lower()
+        if not any(literal in text_lower for literal in INVOLVEMENT_LITERALS):
+            return []
         
-        # Look for individual votes
-        vote_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s*[-:]\s*(YEA|NAY|ABSTAIN|ABSENT)'
-        vote_matches = re.findall(vote_pattern, text, re.IGNORECASE)
+        # Single pass over the text for motion makers, seconders and individual votes
+        for match in INVOLVEMENT_RE.finditer(text):
+            if match.group('mover'):
+                movers.append((match.group('mover'), 'mover', None))
+            elif match.group('seconder'):
+                seconders.append((match.group('seconder'), 'seconder', None))
+            else:
+                voters.append((match.group('voter'), 'voter', match.group('vote').upper()))
         
-        for name, vote in vote_matches:
+        involvement = []
+        for name, role, vote_value in movers + seconders + voters:
             member = self._find_member_by_name(name)
             if member:
                 involvement.append({
                     'member_id': member['id'],
                     'member_name': member['name'],
-                    'role': 'voter',
-                    'vote_value': vote.upper()
+                    'role': role,
+                    'vote_value': vote_value
                 })
         
         return involvement
     
+    def _insert_in_batches(self, table: str, rows: List[Dict]) -> List[Dict]:
+        """Insert rows SUPABASE_BATCH_SIZE at a time and return the inserted records"""
+        inserted = []
+        for start in range(0, len(rows), SUPABASE_BATCH_SIZE):
+            result = self.supabase.table(table).insert(rows[start:start + SUPABASE_BATCH_SIZE]).execute()
+            inserted.extend(result.data or [])
+        return inserted
+    
     def save_meeting_to_supabase(self, meeting_data: Dict, decisions_data: Dict) -> bool:
         """Save meeting and decisions to Supabase"""
         try:
-            # First, save or update the meeting
+            # First, save the meeting
             meeting_record = {
                 'date': meeting_data['date'].isoformat() if meeting_data['date'] else None,
                 'title': meeting_data['title'],
@@ -1021,27 +1130,20 @@ class BoulderMeetingScraper:
                 'minutes_url': meeting_data['url']
             }
             
-            # Check if meeting already exists
-            existing = self.supabase.table('meetings').select('id').eq('date', meeting_data['date']).eq('title', meeting_data['title']).execute()
-            
-            if existing.data:
-                # Update existing meeting
-                meeting_id = existing.data[0]['id']
-                result = self.supabase.table('meetings').update(meeting_record).eq('id', meeting_id).execute()
-                logger.info(f"Updated meeting: {meeting_data['title']}")
-            else:
-                # Insert new meeting
-                result = self.supabase.table('meetings').insert(meeting_record).execute()
-                meeting_id = result.data[0]['id'] if result.data else None
-                logger.info(f"Inserted new meeting: {meeting_data['title']}")
+            # Upsert on (date, title) so reruns update the existing row in one round trip; the
+            # unique index it relies on is in supabase/migrations/20261015000001_meetings_date_title_unique.sql
+            result = self.supabase.table('meetings').upsert(meeting_record, on_conflict='date,title').execute()
+            meeting_id = result.data[0]['id'] if result.data else None
+            logger.info(f"Saved meeting: {meeting_data['title']}")
             
             if not meeting_id:
                 logger.error("Failed to get meeting ID")
                 return False
             
-            # Save decisions
-            for decision in decisions_data.get('decisions', []):
-                decision_record = {
+            # Save decisions in bulk; inserted rows come back in request order
+            decisions = decisions_data.get('decisions', [])
+            decision_records = [
+                {
                     'meeting_id': meeting_id,
                     'title': decision['title'],
                     'description': decision['description'],
@@ -1049,25 +1151,25 @@ class BoulderMeetingScraper:
                     'outcome': decision['outcome'],
                     'source_text': decision['source_text']
                 }
-                
-                # Insert decision
-                decision_result = self.supabase.table('decisions').insert(decision_record).execute()
-                if not decision_result.data:
-                    logger.error(f"Failed to insert decision: {decision['title']}")
-                    continue
-                
-                decision_id = decision_result.data[0]['id']
-                
-                # Save member involvement
-                for involvement in decision.get('member_involvement', []):
-                    involvement_record = {
-                        'decision_id': decision_id,
-                        'member_id': involvement['member_id'],
-                        'role': involvement['role'],
-                        'vote_value': involvement['vote_value']
-                    }
-                    
-                    self.supabase.table('decision_members').insert(involvement_record).execute()
+                for decision in decisions
+            ]
+            inserted = self._insert_in_batches('decisions', decision_records)
+            if len(inserted) != len(decision_records):
+                logger.error(f"Inserted {len(inserted)} of {len(decision_records)} decisions")
+                return False
+            
+            # Save member involvement for every decision in one pass
+            involvement_records = [
+                {
+                    'decision_id': row['id'],
+                    'member_id': involvement['member_id'],
+                    'role': involvement['role'],
+                    'vote_value': involvement['vote_value']
+                }
+                for decision, row in zip(decisions, inserted)
+                for involvement in decision.get('member_involvement', [])
+            ]
+            self._insert_in_batches('decision_members', involvement_records)
             
             logger.info(f"Successfully saved meeting and {len(decisions_data.get('decisions', []))} decisions")
             return True
@@ -1076,7 +1178,90 @@ class BoulderMeetingScraper:
             logger.error(f"Error saving meeting to Supabase: {e}")
             return False
     
-    def run(self, max_meetings: int = 10) -> bool:
+    def _minutes_cache_path(self, meeting_url: str) -> str:
+        """Return the cache file for a meeting URL"""
+        key = hashlib.blake2b(meeting_url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(MEETING_CACHE_DIR, f"{key}.json")
+    
+    def _minutes_validators(self, meeting_url: str) -> Dict[str, Optional[str]]:
+        """HEAD the meeting URL for the ETag and Last-Modified headers"""
+        try:
+            response = self.http.head(meeting_url, allow_redirects=True, timeout=PDF_PROBE_TIMEOUT)
+            return {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        except Exception as e:
+            logger.info(f"Could not check {meeting_url} for changes: {e}")
+            return {'etag': None, 'last_modified': None}
+    
+    def _load_cached_minutes(self, meeting_url: str, validators: Dict[str, Optional[str]]) -> Optional[Dict]:
+        """Return minutes parsed on an earlier run if the server reports the document unchanged"""
+        # Without a validator there is no way to tell whether the document changed
+        if not any(validators.values()):
+            return None
+        
+        try:
+            with open(self._minutes_cache_path(meeting_url)) as f:
+                cached = json.load(f)
+            if cached['etag'] == validators['etag'] and cached['last_modified'] == validators['last_modified']:
+                logger.info(f"Using cached minutes for {meeting_url}")
+                return cached['result']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_cached_minutes(self, meeting_url: str, validators: Dict[str, Optional[str]], result: Dict) -> None:
+        """Remember parsed minutes so later runs can skip unchanged documents"""
+        if not any(validators.values()):
+            return
+        
+        try:
+            os.makedirs(MEETING_CACHE_DIR, exist_ok=True)
+            with open(self._minutes_cache_path(meeting_url), 'w') as f:
+                json.dump({'url': meeting_url, **validators, 'result': result}, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not cache minutes for {meeting_url}: {e}")
+    
+    def _process_one_meeting(self, meeting: Dict) -> bool:
+        """Scrape one meeting's minutes and save its decisions"""
+        try:
+            # Scrape meeting minutes, reusing an earlier run's result if the document hasn't changed
+            validators = self._minutes_validators(meeting['url'])
+            decisions_data = self._load_cached_minutes(meeting['url'], validators)
+            if decisions_data is None:
+                decisions_data = self.scrape_meeting_minutes(meeting['url'])
+                if decisions_data:
+                    self._save_cached_minutes(meeting['url'], validators, decisions_data)
+            
+            if decisions_data and decisions_data.get('decisions'):
+                # Save to Supabase
+                success = self.save_meeting_to_supabase(meeting, decisions_data)
+                if success:
+                    logger.info(f"Successfully processed meeting: {meeting['title']}")
+                else:
+                    logger.error(f"Failed to save meeting: {meeting['title']}")
+                return success
+            
+            logger.warning(f"No decisions found in meeting: {meeting['title']}")
+            return False
+            
+        except Exception as e:
+            logger.error(f"Error processing meeting {meeting.get('title', 'Unknown')}: {e}")
+            return False
+    
+    def _meeting_worker(self, pending: "queue.Queue[Dict]") -> int:
+        """Process meetings from the shared queue until it is empty, then close this thread's browser"""
+        successful_meetings = 0
+        try:
+            while True:
+                try:
+                    meeting = pending.get_nowait()
+                except queue.Empty:
+                    return successful_meetings
+                if self._process_one_meeting(meeting):
+                    successful_meetings += 1
+        finally:
+            self.close()
+    
+    def run(self, max_meetings: int = 10, max_workers: int = MEETING_SCRAPE_WORKERS) -> bool:
         """Run the complete meeting scraping process"""
         logger.info("Starting Boulder City Council meeting scraping...")
         
@@ -1091,27 +1276,16 @@ class BoulderMeetingScraper:
             # Limit to recent meetings
             meetings = sorted(meetings, key=lambda x: x['date'] if x['date'] else date.min, reverse=True)[:max_meetings]
             
-            successful_meetings = 0
-            
+            # Workers pull meetings off a shared queue so a slow meeting doesn't hold
+            # up a fixed batch; each worker drives its own browser
+            pending = queue.Queue()
             for meeting in meetings:
-                try:
-                    # Scrape meeting minutes
-                    decisions_data = self.scrape_meeting_minutes(meeting['url'])
-                    
-                    if decisions_data and decisions_data.get('decisions'):
-                        # Save to Supabase
-                        success = self.save_meeting_to_supabase(meeting, decisions_data)
-                        if success:
-                            successful_meetings += 1
-                            logger.info(f"Successfully processed meeting: {meeting['title']}")
-                        else:
-                            logger.error(f"Failed to save meeting: {meeting['title']}")
-                    else:
-                        logger.warning(f"No decisions found in meeting: {meeting['title']}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing meeting {meeting.get('title', 'Unknown')}: {e}")
-                    continue
+                pending.put(meeting)
+            
+            worker_count = max(1, min(max_workers, len(meetings)))
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                futures = [executor.submit(self._meeting_worker, pending) for _ in range(worker_count)]
+                successful_meetings = sum(future.result() for future in as_completed(futures))
             
             logger.info(f"Successfully processed {successful_meetings} out of {len(meetings)} meetings")
             return successful_meetings > 0
@@ -1119,6 +1293,8 @@ class BoulderMeetingScraper:
         except Exception as e:
             logger.error(f"Error during scraping process: {e}")
             return False
+        finally:
+            self.close()
 
 def main():
     """Main function to run the scraper"""
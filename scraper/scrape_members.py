@@ -8,10 +8,15 @@ import os
 import sys
 import json
 import logging
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, List, Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree, html as lxml_html
 from playwright.sync_api import sync_playwright
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -26,6 +31,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Member pages fetched at once; the work is almost entirely waiting on the network
+MEMBER_PAGE_WORKERS = 8
+
+# Paths where an individual member page may live, all requested at once per member
+MEMBER_PAGE_PATHS = (
+    "/city-council/members/{slug}",
+    "/city-council/member/{slug}",
+    "/government/city-council/members/{slug}",
+)
+
+# Members parsed from the council page on the last run, with the validators to revalidate them
+MEMBERS_CACHE_PATH = '.members_cache.json'
+
+# Only the council member cards are read from the main page, so parse nothing else. The class
+# attribute arrives unsplit here, so cards with more than one class need the explicit split
+PERSON_STRAINER = SoupStrainer(
+    lambda name, attrs: name == 'div' and 'c-person-detail' in (attrs.get('class') or '').split()
+)
+
+# Runs of whitespace in a member name, replaced by a single hyphen in page slugs
+SLUG_SEPARATOR_RE = re.compile(r'\s+')
+
+# Text that marks a list item or span on a member page as a committee assignment
+COMMITTEE_RE = re.compile(r'committee|board|commission', re.IGNORECASE)
+
+# Visible text nodes of a page, evaluated by libxml2 rather than walked in Python
+PAGE_TEXT_XPATH = etree.XPath('//body//text()[normalize-space()][not(parent::script or parent::style)]')
+
+# Words that rule out a text snippet as a member name in the fallback extraction
+NON_NAME_WORDS = frozenset({'city', 'council', 'government', 'boulder', 'colorado'})
+
+# Links on a member page that carry contact details
+CONTACT_LINK_SELECTOR = 'a[href^="mailto:"], a[href^="tel:"], a[href*="linkedin.com"], a[href*="twitter.com"]'
+
+# contact_info key for links whose href starts with a scheme; the scheme is stripped from the value
+CONTACT_SCHEMES = (('mailto:', 'email'), ('tel:', 'phone'))
+
+# contact_info key for links to a social profile; the full href is kept
+CONTACT_SITES = (('linkedin.com', 'linkedin'), ('twitter.com', 'twitter'))
+
 class BoulderCouncilScraper:
     def __init__(self):
         """Initialize the scraper with Supabase connection"""
@@ -39,6 +84,15 @@ class BoulderCouncilScraper:
         self.base_url = "https://bouldercolorado.gov"
         self.members_url = f"{self.base_url}/government/city-council"
         
+        # One pooled session so every page on bouldercolorado.gov reuses the same connections.
+        # The pool holds one connection per concurrent member-page request so none are thrown away
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; City-Council-Tracker)'})
+        self.session.mount('https://', HTTPAdapter(
+            pool_maxsize=MEMBER_PAGE_WORKERS * len(MEMBER_PAGE_PATHS),
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        
     def scrape_members_page(self) -> List[Dict]:
         """
         Scrape the main members page to get basic member information
@@ -46,10 +100,26 @@ class BoulderCouncilScraper:
         logger.info("Scraping main members page...")
         
         try:
-            response = requests.get(self.members_url)
-            response.raise_for_status()
+            # Ask the server whether the page changed since the cached parse
+            cached = self._load_cached_members()
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Hand the decoded body stream to the parser instead of buffering it on the response first
+            with self.session.get(self.members_url, headers=headers, timeout=10, stream=True) as response:
+                if response.status_code == 304 and cached:
+                    logger.info(f"Members page unchanged, reusing {len(cached['members'])} cached members")
+                    return cached['members']
+                
+                response.raise_for_status()
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                response.raw.decode_content = True
+                soup = BeautifulSoup(response.raw, 'lxml', parse_only=PERSON_STRAINER)
             members = []
             
             # Look for the specific person-detail elements that contain council members
@@ -63,21 +133,41 @@ class BoulderCouncilScraper:
                     members.append(member_info)
             
             logger.info(f"Successfully extracted {len(members)} members")
+            if members:
+                self._save_cached_members(members, etag, last_modified)
             return members
             
         except Exception as e:
             logger.error(f"Error scraping main members page: {e}")
             return []
     
+    def _load_cached_members(self) -> Optional[Dict]:
+        """Return the members parsed on an earlier run along with the page's validators"""
+        try:
+            with open(MEMBERS_CACHE_PATH) as f:
+                cached = json.load(f)
+            if cached['members'] and (cached.get('etag') or cached.get('last_modified')):
+                return cached
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    def _save_cached_members(self, members: List[Dict], etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Remember parsed members so an unchanged page can be answered with 304 next run"""
+        if not etag and not last_modified:
+            return
+        
+        try:
+            with open(MEMBERS_CACHE_PATH, 'w') as f:
+                json.dump({'etag': etag, 'last_modified': last_modified, 'members': members}, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not cache members: {e}")
+    
     def _extract_member_from_section(self, section) -> Optional[Dict]:
         """Extract member information from a person-detail section"""
         try:
-            # Extract name from the h3 element
-            name_elem = section.find('h3', class_='c-person-detail__name')
-            if not name_elem:
-                return None
-            
-            name_link = name_elem.find('a')
+            # Extract name from the link in the h3 element
+            name_link = section.select_one('h3.c-person-detail__name a')
             if not name_link:
                 return None
             
@@ -87,7 +177,7 @@ class BoulderCouncilScraper:
             
             # Extract photo URL
             photo_url = None
-            img_elem = section.find('img')
+            img_elem = section.select_one('img')
             if img_elem and img_elem.get('src'):
                 src = img_elem['src']
                 if src.startswith('http'):
@@ -96,7 +186,7 @@ class BoulderCouncilScraper:
                     photo_url = f"{self.base_url}{src}" if src.startswith('/') else f"{self.base_url}/{src}"
             
             # Extract title/position
-            title_elem = section.find('div', class_='c-person-detail__title')
+            title_elem = section.select_one('div.c-person-detail__title')
             seat = "City Council Member"  # Default
             if title_elem:
                 title_text = title_elem.get_text(strip=True)
@@ -104,17 +194,12 @@ class BoulderCouncilScraper:
                     seat = title_text
             
             # Extract term years
-            term_elem = section.find('div', class_='c-person-detail__term')
-            term_years = ""
-            if term_elem:
-                term_item = term_elem.find('p', class_='field__item')
-                if term_item:
-                    term_years = term_item.get_text(strip=True)
+            term_item = section.select_one('div.c-person-detail__term p.field__item')
+            term_years = term_item.get_text(strip=True) if term_item else ""
             
             # Extract individual member page URL for more details
-            member_page_url = None
-            if section.get('data-href'):
-                member_page_url = f"{self.base_url}{section['data-href']}"
+            data_href = section.get('data-href')
+            member_page_url = f"{self.base_url}{data_href}" if data_href else None
             
             return {
                 'name': name,
@@ -130,7 +215,7 @@ class BoulderCouncilScraper:
             logger.error(f"Error extracting member from section: {e}")
             return None
     
-    def _fallback_member_extraction(self, soup) -> List[Dict]:
+    def _fallback_member_extraction(self, content: bytes) -> List[Dict]:
         """Fallback method to extract members using different selectors"""
         logger.info("Using fallback member extraction method...")
         members = []
@@ -141,10 +226,12 @@ class BoulderCouncilScraper:
             potential_names = []
             
             # Look for text that might be names (capitalized words, 2-3 words)
-            for text in soup.stripped_strings:
-                if len(text.split()) in [2, 3] and text[0].isupper():
+            for node in PAGE_TEXT_XPATH(lxml_html.fromstring(content)):
+                text = node.strip()
+                words = text.lower().split()
+                if len(words) in (2, 3) and text[0].isupper():
                     # Filter out common non-name text
-                    if not any(word.lower() in ['city', 'council', 'government', 'boulder', 'colorado'] for word in text.split()):
+                    if NON_NAME_WORDS.isdisjoint(words):
                         potential_names.append(text)
             
             # Take the first few potential names as members
@@ -170,41 +257,43 @@ class BoulderCouncilScraper:
         """
         logger.info("Scraping individual member pages...")
         
-        updated_members = []
-        
-        for member in members:
-            try:
-                # Try to find individual member page
-                member_page_info = self._scrape_member_page(member)
-                if member_page_info:
-                    member.update(member_page_info)
-                
-                updated_members.append(member)
-                
-            except Exception as e:
-                logger.error(f"Error scraping individual page for {member.get('name', 'Unknown')}: {e}")
-                updated_members.append(member)
+        # Member pages are independent, so fetch them concurrently; map keeps the input order
+        with ThreadPoolExecutor(max_workers=min(MEMBER_PAGE_WORKERS, len(members)) or 1) as executor:
+            return list(executor.map(self._scrape_and_update_member, members))
+    
+    def _scrape_and_update_member(self, member: Dict) -> Dict:
+        """Merge one member's individual page details into the member record"""
+        try:
+            # Try to find individual member page
+            member_page_info = self._scrape_member_page(member)
+            if member_page_info:
+                member.update(member_page_info)
+            
+        except Exception as e:
+            logger.error(f"Error scraping individual page for {member.get('name', 'Unknown')}: {e}")
         
-        return updated_members
+        return member
     
     def _scrape_member_page(self, member: Dict) -> Optional[Dict]:
         """Scrape individual member page for additional details"""
         try:
             # Try to construct member page URL
-            name_slug = member['name'].lower().replace(' ', '-')
-            potential_urls = [
-                f"{self.base_url}/city-council/members/{name_slug}",
-                f"{self.base_url}/city-council/member/{name_slug}",
-                f"{self.base_url}/government/city-council/members/{name_slug}"
-            ]
-            
-            for url in potential_urls:
-                try:
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        return self._parse_member_page(response.content, member)
-                except:
-                    continue
+            name_slug = SLUG_SEPARATOR_RE.sub('-', member['name'].strip().lower())
+            potential_urls = [f"{self.base_url}{path.format(slug=name_slug)}" for path in MEMBER_PAGE_PATHS]
+            
+            # Request every candidate at once and take the first page that exists;
+            # requests still in flight are left to finish in the background
+            executor = ThreadPoolExecutor(max_workers=len(potential_urls))
+            try:
+                pending = {executor.submit(self._fetch_member_page, url, member) for url in potential_urls}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        updates = future.result()
+                        if updates is not None:
+                            return updates
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
             
             return None
             
@@ -212,14 +301,25 @@ class BoulderCouncilScraper:
             logger.error(f"Error in _scrape_member_page: {e}")
             return None
     
+    def _fetch_member_page(self, url: str, member: Dict) -> Optional[Dict]:
+        """Parse url as the member's page, or return None if it doesn't exist"""
+        try:
+            with self.session.get(url, timeout=10, stream=True) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    return self._parse_member_page(response.raw, member)
+        except Exception:
+            pass
+        return None
+    
     def _parse_member_page(self, content, member: Dict) -> Dict:
         """Parse individual member page content"""
-        soup = BeautifulSoup(content, 'html.parser')
+        soup = BeautifulSoup(content, 'lxml')
         updates = {}
         
         try:
             # Look for additional bio text
-            bio_elements = soup.find_all(['p', 'div'], string=lambda x: x and len(x) > 50)
+            bio_elements = [elem for elem in soup.select('p, div') if elem.string and len(elem.string) > 50]
             if bio_elements:
                 # Combine all bio text
                 bio_text = ' '.join([elem.get_text(strip=True) for elem in bio_elements[:3]])
@@ -227,23 +327,23 @@ class BoulderCouncilScraper:
                     updates['bio'] = bio_text
             
             # Look for committees
-            committee_elements = soup.find_all(['li', 'span'], string=lambda x: x and any(word in x.lower() for word in ['committee', 'board', 'commission']))
+            committee_elements = [elem for elem in soup.select('li, span') if elem.string and COMMITTEE_RE.search(elem.string)]
             if committee_elements:
                 committees = [elem.get_text(strip=True) for elem in committee_elements]
                 updates['committees'] = committees
             
             # Look for additional contact info
-            contact_elements = soup.find_all('a', href=True)
-            for elem in contact_elements:
+            for elem in soup.select(CONTACT_LINK_SELECTOR):
                 href = elem['href']
-                if 'mailto:' in href:
-                    updates.setdefault('contact_info', {})['email'] = href.replace('mailto:', '')
-                elif 'tel:' in href:
-                    updates.setdefault('contact_info', {})['phone'] = href.replace('tel:', '')
-                elif 'linkedin.com' in href:
-                    updates.setdefault('contact_info', {})['linkedin'] = href
-                elif 'twitter.com' in href:
-                    updates.setdefault('contact_info', {})['twitter'] = href
+                for scheme, key in CONTACT_SCHEMES:
+                    if href.startswith(scheme):
+                        updates.setdefault('contact_info', {})[key] = href[len(scheme):]
+                        break
+                else:
+                    for site, key in CONTACT_SITES:
+                        if site in href:
+                            updates.setdefault('contact_info', {})[key] = href
+                            break
             
         except Exception as e:
             logger.error(f"Error parsing member page: {e}")
@@ -255,27 +355,27 @@ class BoulderCouncilScraper:
         logger.info(f"Saving {len(members)} members to Supabase...")
         
         try:
-            for member in members:
-                # Check if member already exists
-                existing = self.supabase.table('members').select('id').eq('name', member['name']).execute()
-                
-                if existing.data:
-                    # Update existing member
-                    member_id = existing.data[0]['id']
-                    result = self.supabase.table('members').update(member).eq('id', member_id).execute()
-                    logger.info(f"Updated member: {member['name']}")
-                else:
-                    # Insert new member
-                    result = self.supabase.table('members').insert(member).execute()
-                    logger.info(f"Inserted new member: {member['name']}")
-                
-                # Check for errors in the new response format
-                if hasattr(result, 'error') and result.error:
-                    logger.error(f"Error saving member {member['name']}: {result.error}")
-                elif hasattr(result, 'data') and not result.data:
-                    logger.error(f"Error saving member {member['name']}: No data returned")
+            # Postgres rejects an upsert that touches the same name twice, so keep the last
+            # scraped entry for each name
+            unique_members = list({member['name']: member for member in members}.values())
+            if len(unique_members) < len(members):
+                logger.warning(f"Dropped {len(members) - len(unique_members)} duplicate member names before saving")
+            
+            # One bulk upsert keyed on the unique member name instead of a select and write per member
+            result = self.supabase.table('members').upsert(unique_members, on_conflict='name').execute()
+            
+            # Check for errors in the new response format
+            if hasattr(result, 'error') and result.error:
+                logger.error(f"Error saving members: {result.error}")
+                return False
+            elif hasattr(result, 'data') and not result.data:
+                logger.error("Error saving members: No data returned")
+                return False
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Upserted members: {', '.join(member['name'] for member in result.data)}")
             
-            logger.info("Successfully saved all members to Supabase")
+            logger.info(f"Successfully upserted {len(result.data)} members to Supabase")
             return True
             
         except Exception as e:
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests for member involvement extraction in scrape_meetings
+"""
+
+from scrape_meetings import BoulderMeetingScraper
+
+
+def make_scraper():
+    """Build a scraper without Supabase or a browser; every name resolves to itself"""
+    scraper = BoulderMeetingScraper.__new__(BoulderMeetingScraper)
+    scraper._find_member_by_name = lambda name: {'id': name, 'name': name}
+    return scraper
+
+
+def involvement_roles(text):
+    """Return (name, role, vote_value) for each involvement found in text"""
+    return [
+        (entry['member_name'], entry['role'], entry['vote_value'])
+        for entry in make_scraper()._extract_member_involvement(text)
+    ]
+
+
+def test_mover_seconder_and_votes_in_one_section():
+    text = "Motion by Weaver\nSecond by Brockett\nThe motion passed. Vote: Weaver - YEA\nBrockett - NAY"
+    assert involvement_roles(text) == [
+        ('Weaver', 'mover', None),
+        ('Brockett', 'seconder', None),
+        ('Weaver', 'voter', 'YEA'),
+        ('Brockett', 'voter', 'NAY'),
+    ]
+
+
+def test_seconder_on_the_same_line_as_the_mover():
+    assert involvement_roles("Motion by Weaver second by Brockett") == [
+        ('Weaver', 'mover', None),
+        ('Brockett', 'seconder', None),
+    ]
@@ -4,8 +4,26 @@ Test script to find correct photo URLs from Boulder government website
 """
 
 import requests
-from bs4 import BeautifulSoup
-import json
+from bs4 import BeautifulSoup, SoupStrainer
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+
+# Shared session so the page fetch and every photo check reuse one connection
+SESSION = requests.Session()
+
+# Only images and person-detail cards are inspected; everything else is skipped while parsing
+PHOTO_STRAINER = SoupStrainer(
+    lambda name, attrs: name == 'img'
+    or (name == 'div' and 'c-person-detail' in (attrs.get('class') or '').split())
+)
+
+def check_photo_url(url):
+    """HEAD a photo URL and describe the outcome"""
+    try:
+        img_response = SESSION.head(url, timeout=5)
+        return f"Status: {img_response.status_code}"
+    except Exception as e:
+        return f"Error: {e}"
 
 def test_photo_urls():
     """Test scraping photo URLs from Boulder government website"""
@@ -17,10 +35,10 @@ def test_photo_urls():
     print(f"URL: {members_url}")
     
     try:
-        response = requests.get(members_url)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        with SESSION.get(members_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            soup = BeautifulSoup(response.raw, 'lxml', parse_only=PHOTO_STRAINER)
         
         # Look for images
         images = soup.find_all('img')
@@ -49,11 +67,13 @@ def test_photo_urls():
         person_details = soup.find_all('div', class_='c-person-detail')
         print(f"\nFound {len(person_details)} person-detail sections")
         
+        # Collect every member photo first so the URL checks can run concurrently
+        members = []
         for section in person_details:
             name_elem = section.find('h3', class_='c-person-detail__name')
             if name_elem:
                 name = name_elem.get_text(strip=True)
-                print(f"\nMember: {name}")
+                photo = None
                 
                 img_elem = section.find('img')
                 if img_elem:
@@ -61,15 +81,21 @@ def test_photo_urls():
                     alt = img_elem.get('alt', '')
                     if src:
                         full_url = f"{base_url}{src}" if src.startswith('/') else src
-                        print(f"  Photo URL: {full_url}")
-                        print(f"  Alt text: {alt}")
-                        
-                        # Test if the URL works
-                        try:
-                            img_response = requests.head(full_url, timeout=5)
-                            print(f"  Status: {img_response.status_code}")
-                        except Exception as e:
-                            print(f"  Error: {e}")
+                        photo = (full_url, alt)
+                members.append((name, photo))
+        
+        # Test if the URLs work
+        photo_urls = [photo[0] for _, photo in members if photo]
+        with ThreadPoolExecutor(max_workers=len(photo_urls) or 1) as executor:
+            statuses = dict(zip(photo_urls, executor.map(check_photo_url, photo_urls)))
+        
+        for name, photo in members:
+            print(f"\nMember: {name}")
+            if photo:
+                full_url, alt = photo
+                print(f"  Photo URL: {full_url}")
+                print(f"  Alt text: {alt}")
+                print(f"  {statuses[full_url]}")
         
         # Save results to file
         results = {
@@ -77,8 +103,8 @@ def test_photo_urls():
             'person_details_count': len(person_details)
         }
         
-        with open('photo_url_test_results.json', 'w') as f:
-            json.dump(results, f, indent=2)
+        with open('photo_url_test_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
         
         print(f"\nResults saved to photo_url_test_results.json")
         
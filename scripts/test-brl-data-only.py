@@ -6,26 +6,59 @@ Tests the actual scraping functionality without requiring Supabase
 
 import sys
 import os
-import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 import io
 from datetime import datetime
 
+# Shared session so the BRL page and Google Sheets requests reuse connections; responses are
+# cached on disk for an hour, so the page-content fallback doesn't refetch the BRL page
+SESSION = requests_cache.CachedSession(
+    'brl_cache',
+    backend='sqlite',
+    expire_after=3600,
+    allowable_methods=('GET', 'HEAD'),
+    cache_control=True
+)
+
+# Retry transient BRL / Google Sheets failures with backoff on the pooled keep-alive connections
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(['GET'])
+)))
+
+# (connect, read) timeouts in seconds so a stalled connection can't hang the script
+REQUEST_TIMEOUT = (5, 30)
+
+# Rows belonging to a table itself, whether or not they sit in a thead/tbody/tfoot
+TABLE_ROW_SELECTOR = ':scope > tr, :scope > thead > tr, :scope > tbody > tr, :scope > tfoot > tr'
+
+# Vote mentions in free page text: "<name> voted YEA", "YEA vote by <name>", "<name> - YEA"
+VOTE_PATTERNS = [
+    re.compile(r'(\w+\s+\w+)\s+(?:voted|moved|seconded)\s+(YEA|NAY|ABSTAIN)', re.IGNORECASE),
+    re.compile(r'(YEA|NAY|ABSTAIN)\s+vote\s+by\s+(\w+\s+\w+)', re.IGNORECASE),
+    re.compile(r'(\w+\s+\w+)\s*-\s*(YEA|NAY|ABSTAIN)', re.IGNORECASE)
+]
+
 def test_brl_website_access():
     """Test basic access to BRL website"""
     print("🌐 Testing BRL website access...")
     
     try:
         url = "https://boulderreportinglab.org/boulder-city-council-vote-tracker/"
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         print(f"✅ Successfully accessed BRL website (Status: {response.status_code})")
         
         # Parse the page
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Look for spreadsheet links
         spreadsheet_links = []
@@ -55,11 +88,11 @@ def scrape_google_sheets(sheets_url):
             csv_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
             
             print(f"📥 Accessing CSV export: {csv_url}")
-            response = requests.get(csv_url)
+            response = SESSION.get(csv_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            # Parse CSV data
-            df = pd.read_csv(io.StringIO(response.text))
+            # Parse the CSV bytes directly with the C engine, skipping a decoded text copy
+            df = pd.read_csv(io.BytesIO(response.content), encoding='utf-8', engine='c')
             print(f"✅ Successfully loaded {len(df)} rows from Google Sheets")
             print(f"📋 Columns: {list(df.columns)}")
             
@@ -78,18 +111,33 @@ def extract_data_from_page():
         print("\n📄 Attempting to extract data from page content...")
         
         url = "https://boulderreportinglab.org/boulder-city-council-vote-tracker/"
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Look for tables
         tables = soup.find_all('table')
         print(f"📋 Found {len(tables)} tables on the page")
         
+        # Build the first table straight from the parsed cells instead of serializing it and
+        # having pandas parse the HTML again. Only the table's own rows and cells are read, so a
+        # nested table isn't counted twice, and empty spacer rows are skipped
+        rows = []
         if tables:
-            # Try to parse the first table
-            df = pd.read_html(str(tables[0]))[0]
+            for tr in tables[0].select(TABLE_ROW_SELECTOR):
+                cells = [cell.get_text(' ', strip=True) for cell in tr.find_all(['td', 'th'], recursive=False)]
+                if cells:
+                    rows.append(cells)
+        
+        if rows:
+            # Pad or truncate every row to the header width; colspan/rowspan and caption rows
+            # can leave rows with a different cell count
+            width = len(rows[0])
+            df = pd.DataFrame.from_records(
+                [row[:width] + [''] * (width - len(row)) for row in rows[1:]],
+                columns=rows[0]
+            )
             print(f"✅ Successfully parsed table with {len(df)} rows")
             return df
         
@@ -97,17 +145,11 @@ def extract_data_from_page():
         print("🔍 Looking for vote patterns in page text...")
         page_text = soup.get_text()
         
-        # Look for vote-related content
-        vote_patterns = [
-            r'(\w+\s+\w+)\s+(?:voted|moved|seconded)\s+(YEA|NAY|ABSTAIN)',
-            r'(YEA|NAY|ABSTAIN)\s+vote\s+by\s+(\w+\s+\w+)',
-            r'(\w+\s+\w+)\s*-\s*(YEA|NAY|ABSTAIN)'
-        ]
-        
         extracted_data = []
         
-        for pattern in vote_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
+        # Look for vote-related content
+        for pattern in VOTE_PATTERNS:
+            matches = pattern.findall(page_text)
             for match in matches:
                 if len(match) == 2:
                     member_name, vote = match
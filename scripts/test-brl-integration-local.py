@@ -6,14 +6,62 @@ Saves real data to local files instead of requiring Supabase
 
 import sys
 import os
-import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import numpy as np
 import pandas as pd
 import re
 import io
-import json
+import orjson
 from datetime import datetime
 
+# Shared session so repeated requests to the same host reuse their connection. The sheet export
+# is cached on disk for an hour, then revalidated with ETag/Last-Modified
+SESSION = requests_cache.CachedSession(
+    'brl_cache',
+    backend='sqlite',
+    expire_after=3600,
+    cache_control=True
+)
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; City-Council-Tracker)'})
+
+# Retry transient BRL / Google Sheets failures with backoff on the pooled keep-alive connections
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset(['GET'])
+)))
+
+# (connect, read) timeouts in seconds so a stalled connection can't hang the script
+REQUEST_TIMEOUT = (5, 30)
+
+# orjson options for the local JSON artifacts: indented, with numpy scalars and non-string keys
+# (from value_counts) serialized natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Columns of the BRL spreadsheet kept in the processed records, in output order
+BRL_COLUMNS = [
+    'date', 'councilmember', 'attendance', 'vote_type', 'ordinance_num',
+    'agenda_item_desc_1', 'agenda_item_desc_2', 'code', 'vote'
+]
+
+# Low-cardinality columns stored as category so the summary's value_counts/unique work on codes
+BRL_CATEGORY_COLUMNS = ['councilmember', 'vote', 'vote_type', 'attendance', 'code']
+
+# Spreadsheet rows parsed at a time while streaming the CSV
+BRL_CSV_CHUNK_SIZE = 10_000
+
+# Convert lowercased BRL vote values to our format; anything else is kept as-is
+VOTE_MAPPING = {
+    'y': 'yea',
+    'n': 'nay',
+    'na': 'abstain',
+    'tk': 'absent'
+}
+
 def scrape_brl_data():
     """Scrape real data from BRL vote tracker"""
     print("🌐 Scraping Boulder Reporting Lab vote tracker...")
@@ -21,11 +69,20 @@ def scrape_brl_data():
     try:
         # Get the Google Sheets data
         sheets_url = "https://docs.google.com/spreadsheets/d/1tVtOs2Fc69iOKJJH0k3w91DXpqQmNVtdkR5vCHdqWiM/export?format=csv"
-        response = requests.get(sheets_url)
-        response.raise_for_status()
         
-        # Parse CSV data
-        df = pd.read_csv(io.StringIO(response.text))
+        # Feed the CSV to the C parser a chunk of rows at a time, only tokenizing the columns
+        # process_brl_data keeps. The cached session reads the body itself when storing it,
+        # so the buffered content is parsed rather than response.raw
+        response = SESSION.get(sheets_url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        with pd.read_csv(
+            io.BytesIO(response.content),
+            encoding='utf-8',
+            engine='c',
+            usecols=BRL_COLUMNS,
+            chunksize=BRL_CSV_CHUNK_SIZE
+        ) as reader:
+            df = pd.concat(reader, ignore_index=True)
         print(f"✅ Successfully loaded {len(df)} rows from BRL vote tracker")
         
         return df
@@ -41,86 +98,76 @@ def process_brl_data(df):
     if df is None or df.empty:
         return None
     
-    # Clean and standardize the data
-    processed_data = []
-    
-    for _, row in df.iterrows():
-        try:
-            # Convert vote values to our format
-            vote_mapping = {
-                'y': 'yea',
-                'n': 'nay', 
-                'na': 'abstain',
-                'TK': 'absent'
-            }
-            
-            vote_value = vote_mapping.get(row['vote'].lower(), row['vote'].lower())
-            
-            # Create processed record
-            processed_record = {
-                'date': row['date'],
-                'councilmember': row['councilmember'],
-                'attendance': row['attendance'],
-                'vote_type': row['vote_type'],
-                'ordinance_num': row['ordinance_num'],
-                'agenda_item_desc_1': row['agenda_item_desc_1'],
-                'agenda_item_desc_2': row['agenda_item_desc_2'],
-                'code': row['code'],
-                'vote': vote_value,
-                'source': 'BRL Vote Tracker'
-            }
-            
-            processed_data.append(processed_record)
-            
-        except Exception as e:
-            print(f"⚠️  Error processing row: {e}")
-            continue
+    try:
+        # Rows without a vote can't be mapped and are skipped
+        df = df[df['vote'].notna()]
+        votes = df['vote'].astype(str).str.lower().to_numpy()
+        
+        # Clean and standardize the data column-wise instead of row by row; unmapped
+        # codes pass through lowercased
+        processed_data = df[BRL_COLUMNS].assign(
+            vote=np.select([votes == code for code in VOTE_MAPPING], list(VOTE_MAPPING.values()), default=votes),
+            source='BRL Vote Tracker'
+        ).astype(dict.fromkeys(BRL_CATEGORY_COLUMNS, 'category'))
+        
+    except KeyError as e:
+        print(f"❌ BRL data is missing expected column: {e}")
+        return None
     
     print(f"✅ Processed {len(processed_data)} records")
     return processed_data
 
 def save_data_locally(data, filename='brl_data.json'):
-    """Save processed data to local file"""
+    """Save the processed DataFrame to a local JSON file of records"""
     print(f"💾 Saving data to {filename}...")
     
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # pandas writes the records straight from its columns, without building Python dicts
+        data.to_json(filename, orient='records', indent=2, date_format='iso')
         
         print(f"✅ Data saved to {filename}")
+        
+        # Keep a columnar copy as well; it is far smaller and reloads quickly with pd.read_parquet
+        parquet_filename = f"{os.path.splitext(filename)[0]}.parquet"
+        try:
+            data.to_parquet(parquet_filename, compression='zstd', index=False)
+            print(f"✅ Columnar copy saved to {parquet_filename}")
+        except Exception as e:
+            print(f"⚠️  Skipped Parquet copy ({e})")
         return True
         
     except Exception as e:
         print(f"❌ Error saving data: {e}")
         return False
 
-def create_summary_report(data):
-    """Create a summary report of the extracted data"""
+def create_summary_report(df):
+    """Create a summary report of the processed DataFrame"""
     print("\n📊 Creating summary report...")
     
-    if not data:
+    if df is None or df.empty:
         print("❌ No data to summarize")
         return
     
-    # Convert back to DataFrame for analysis
-    df = pd.DataFrame(data)
+    # Count the dates once; the date range comes from the distinct dates rather than two more scans
+    date_counts = df['date'].value_counts()
     
+    # value_counts drops missing values, so none of the counts below carry NaN keys
     summary = {
-        'total_records': len(data),
+        'total_records': len(df),
         'date_range': {
-            'start': df['date'].min(),
-            'end': df['date'].max()
+            'start': date_counts.index.min(),
+            'end': date_counts.index.max()
         },
         'council_members': sorted(df['councilmember'].unique()),
         'vote_distribution': df['vote'].value_counts().to_dict(),
-        'meeting_dates': df['date'].value_counts().head(10).to_dict(),
+        'meeting_dates': date_counts.head(10).to_dict(),
         'vote_types': df['vote_type'].value_counts().to_dict(),
         'top_agenda_items': df['agenda_item_desc_1'].value_counts().head(5).to_dict()
     }
     
     # Save summary
-    with open('brl_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2, default=str)
+    with open('brl_summary.json', 'wb') as f:
+        f.write(orjson.dumps(summary, default=str, option=JSON_OPTIONS))
     
     print("✅ Summary report saved to brl_summary.json")
     return summary
@@ -153,8 +200,7 @@ def display_summary(summary):
     
     print(f"\n📄 Top Agenda Items:")
     for item, count in summary['top_agenda_items'].items():
-        if pd.notna(item):
-            print(f"   - {item[:60]}... ({count} votes)")
+        print(f"   - {item[:60]}... ({count} votes)")
     
     print("\n" + "="*60)
     print("✅ REAL DATA SUCCESSFULLY EXTRACTED AND PROCESSED!")
@@ -171,19 +217,19 @@ def main():
         return
     
     # Step 2: Process the data
-    processed_data = process_brl_data(df)
+    processed_df = process_brl_data(df)
     
-    if not processed_data:
+    if processed_df is None or processed_df.empty:
         print("❌ Failed to process data")
         return
     
     # Step 3: Save data locally
-    if not save_data_locally(processed_data):
+    if not save_data_locally(processed_df):
         print("❌ Failed to save data")
         return
     
     # Step 4: Create and display summary
-    summary = create_summary_report(processed_data)
+    summary = create_summary_report(processed_df)
     if summary:
         display_summary(summary)
     
@@ -0,0 +1,5 @@
+-- scrape_meetings.py upserts meetings with on_conflict='date,title'; PostgREST needs a
+-- matching unique index for that ON CONFLICT target.
+-- Fails if duplicate (date, title) rows already exist; merge those first:
+--   SELECT date, title, COUNT(*) FROM meetings GROUP BY date, title HAVING COUNT(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_meetings_date_title ON meetings(date, title);
@@ -0,0 +1,17 @@
+-- Legacy-only: scrape_boulder_reporting_lab.py writes to the pre-schema.sql votes table, whose
+-- columns are item_id/member_id rather than agenda_item_id/council_member_id, and upserts votes on
+-- (item_id, member_id). Databases built from schema.sql don't have those columns (their votes
+-- already have UNIQUE(agenda_item_id, council_member_id)), so the index is only created where
+-- they exist. Meetings reuse idx_meetings_date_title and agenda items
+-- idx_agenda_items_meeting_id_title from 20261015000004.
+-- Fails on a legacy database if duplicate rows already exist; merge those first:
+--   SELECT item_id, member_id, COUNT(*) FROM votes GROUP BY item_id, member_id HAVING COUNT(*) > 1;
+DO $$
+BEGIN
+    IF (
+        SELECT COUNT(*) FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'votes' AND column_name IN ('item_id', 'member_id')
+    ) = 2 THEN
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_votes_item_id_member_id ON votes(item_id, member_id);
+    END IF;
+END $$;
@@ -0,0 +1,18 @@
+-- scrape_members.py upserts members with on_conflict='name'; PostgREST needs a matching
+-- unique index for that ON CONFLICT target. Databases that predate the members table in
+-- schema.sql get it here; existing ones only gain the index.
+CREATE TABLE IF NOT EXISTS members (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    name VARCHAR(255) NOT NULL UNIQUE,
+    seat VARCHAR(100),
+    bio TEXT,
+    photo_url TEXT,
+    contact_info JSONB,
+    committees TEXT[],
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+-- Fails if duplicate names already exist; merge those first:
+--   SELECT name, COUNT(*) FROM members GROUP BY name HAVING COUNT(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_members_name ON members(name);
@@ -0,0 +1,8 @@
+-- BRL imports upsert meetings on (city_id, date, meeting_type) and agenda items on
+-- (meeting_id, title). schema.sql declares both constraints, but databases created before
+-- they were added need the matching unique indexes for those ON CONFLICT targets.
+-- Fails if duplicate rows already exist; merge those first:
+--   SELECT city_id, date, meeting_type, COUNT(*) FROM meetings GROUP BY city_id, date, meeting_type HAVING COUNT(*) > 1;
+--   SELECT meeting_id, title, COUNT(*) FROM agenda_items GROUP BY meeting_id, title HAVING COUNT(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_meetings_city_id_date_meeting_type ON meetings(city_id, date, meeting_type);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_agenda_items_meeting_id_title ON agenda_items(meeting_id, title);
@@ -0,0 +1,52 @@
+-- scrape_boulder_reporting_lab_new.py imports BRL votes with a single bulk_insert_brl RPC call.
+-- Same definition as schema.sql, so existing databases get it without running reset-schema.sql.
+-- Relies on the unique indexes from 20261015000004_brl_natural_key_unique.sql.
+-- Each record is {date, agenda_item_title, category, council_member_id, vote_value, source_name};
+-- meetings and agenda items are created on demand and existing votes are updated in place.
+CREATE OR REPLACE FUNCTION bulk_insert_brl(p_city_id UUID, p_records JSONB, p_source_url TEXT)
+RETURNS INTEGER AS $$
+DECLARE
+    vote_count INTEGER;
+BEGIN
+    CREATE TEMP TABLE brl_import ON COMMIT DROP AS
+    SELECT * FROM jsonb_to_recordset(p_records) AS r(
+        date DATE,
+        agenda_item_title TEXT,
+        category TEXT,
+        council_member_id UUID,
+        vote_value vote_value,
+        source_name TEXT
+    );
+
+    INSERT INTO meetings (city_id, date, title, meeting_type, status)
+    SELECT DISTINCT p_city_id, i.date, 'BRL Vote Tracker Meeting - ' || i.date, 'Regular Council Meeting', 'completed'
+    FROM brl_import i
+    ON CONFLICT (city_id, date, meeting_type) DO NOTHING;
+
+    INSERT INTO agenda_items (meeting_id, title, category, tags)
+    SELECT DISTINCT ON (m.id, i.agenda_item_title)
+        m.id,
+        i.agenda_item_title,
+        i.category,
+        CASE WHEN i.category = 'Unknown' THEN ARRAY[]::TEXT[] ELSE ARRAY[i.category] END
+    FROM brl_import i
+    JOIN meetings m ON m.city_id = p_city_id AND m.date = i.date AND m.meeting_type = 'Regular Council Meeting'
+    ON CONFLICT (meeting_id, title) DO NOTHING;
+
+    INSERT INTO votes (agenda_item_id, council_member_id, vote_value, source_url, source_name)
+    SELECT DISTINCT ON (a.id, i.council_member_id)
+        a.id,
+        i.council_member_id,
+        i.vote_value,
+        p_source_url,
+        i.source_name
+    FROM brl_import i
+    JOIN meetings m ON m.city_id = p_city_id AND m.date = i.date AND m.meeting_type = 'Regular Council Meeting'
+    JOIN agenda_items a ON a.meeting_id = m.id AND a.title = i.agenda_item_title
+    ON CONFLICT (agenda_item_id, council_member_id) DO UPDATE
+    SET vote_value = EXCLUDED.vote_value, source_url = EXCLUDED.source_url, source_name = EXCLUDED.source_name;
+
+    GET DIAGNOSTICS vote_count = ROW_COUNT;
+    RETURN vote_count;
+END;
+$$ language 'plpgsql';
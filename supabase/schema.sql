@@ -33,6 +33,20 @@ CREATE TABLE council_members (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Members table (flat roster written by scrape_members.py and read by the scrapers and the
+-- members edge function); one row per member name
+CREATE TABLE members (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    name VARCHAR(255) NOT NULL UNIQUE,
+    seat VARCHAR(100),
+    bio TEXT,
+    photo_url TEXT,
+    contact_info JSONB,
+    committees TEXT[],
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
 -- Meetings table (normalized)
 CREATE TABLE meetings (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -45,7 +59,8 @@ CREATE TABLE meetings (
     video_url TEXT,
     status VARCHAR(50) DEFAULT 'scheduled', -- scheduled, completed, cancelled
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE(city_id, date, meeting_type) -- One meeting of each type per city per day
 );
 
 -- Agenda items table (normalized)
@@ -58,7 +73,8 @@ CREATE TABLE agenda_items (
     category VARCHAR(100), -- Budget, Zoning, Public Safety, etc.
     tags TEXT[],
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    UNIQUE(meeting_id, title) -- One agenda item per title per meeting
 );
 
 -- Votes table (normalized)
@@ -109,14 +125,67 @@ $$ language 'plpgsql';
 -- Apply updated_at trigger to all tables
 CREATE TRIGGER update_cities_updated_at BEFORE UPDATE ON cities FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_council_members_updated_at BEFORE UPDATE ON council_members FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+CREATE TRIGGER update_members_updated_at BEFORE UPDATE ON members FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_meetings_updated_at BEFORE UPDATE ON meetings FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_agenda_items_updated_at BEFORE UPDATE ON agenda_items FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_votes_updated_at BEFORE UPDATE ON votes FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_quotes_updated_at BEFORE UPDATE ON quotes FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Bulk import of BRL vote tracker records in a single transaction.
+-- Each record is {date, agenda_item_title, category, council_member_id, vote_value, source_name};
+-- meetings and agenda items are created on demand and existing votes are updated in place.
+CREATE OR REPLACE FUNCTION bulk_insert_brl(p_city_id UUID, p_records JSONB, p_source_url TEXT)
+RETURNS INTEGER AS $$
+DECLARE
+    vote_count INTEGER;
+BEGIN
+    CREATE TEMP TABLE brl_import ON COMMIT DROP AS
+    SELECT * FROM jsonb_to_recordset(p_records) AS r(
+        date DATE,
+        agenda_item_title TEXT,
+        category TEXT,
+        council_member_id UUID,
+        vote_value vote_value,
+        source_name TEXT
+    );
+
+    INSERT INTO meetings (city_id, date, title, meeting_type, status)
+    SELECT DISTINCT p_city_id, i.date, 'BRL Vote Tracker Meeting - ' || i.date, 'Regular Council Meeting', 'completed'
+    FROM brl_import i
+    ON CONFLICT (city_id, date, meeting_type) DO NOTHING;
+
+    INSERT INTO agenda_items (meeting_id, title, category, tags)
+    SELECT DISTINCT ON (m.id, i.agenda_item_title)
+        m.id,
+        i.agenda_item_title,
+        i.category,
+        CASE WHEN i.category = 'Unknown' THEN ARRAY[]::TEXT[] ELSE ARRAY[i.category] END
+    FROM brl_import i
+    JOIN meetings m ON m.city_id = p_city_id AND m.date = i.date AND m.meeting_type = 'Regular Council Meeting'
+    ON CONFLICT (meeting_id, title) DO NOTHING;
+
+    INSERT INTO votes (agenda_item_id, council_member_id, vote_value, source_url, source_name)
+    SELECT DISTINCT ON (a.id, i.council_member_id)
+        a.id,
+        i.council_member_id,
+        i.vote_value,
+        p_source_url,
+        i.source_name
+    FROM brl_import i
+    JOIN meetings m ON m.city_id = p_city_id AND m.date = i.date AND m.meeting_type = 'Regular Council Meeting'
+    JOIN agenda_items a ON a.meeting_id = m.id AND a.title = i.agenda_item_title
+    ON CONFLICT (agenda_item_id, council_member_id) DO UPDATE
+    SET vote_value = EXCLUDED.vote_value, source_url = EXCLUDED.source_url, source_name = EXCLUDED.source_name;
+
+    GET DIAGNOSTICS vote_count = ROW_COUNT;
+    RETURN vote_count;
+END;
+$$ language 'plpgsql';
+
 -- Enable Row Level Security (RLS)
 ALTER TABLE cities ENABLE ROW LEVEL SECURITY;
 ALTER TABLE council_members ENABLE ROW LEVEL SECURITY;
+ALTER TABLE members ENABLE ROW LEVEL SECURITY;
 ALTER TABLE meetings ENABLE ROW LEVEL SECURITY;
 ALTER TABLE agenda_items ENABLE ROW LEVEL SECURITY;
 ALTER TABLE votes ENABLE ROW LEVEL SECURITY;
@@ -125,6 +194,7 @@ ALTER TABLE quotes ENABLE ROW LEVEL SECURITY;
 -- Create policies for public read access
 CREATE POLICY "Allow public read access to cities" ON cities FOR SELECT USING (true);
 CREATE POLICY "Allow public read access to council_members" ON council_members FOR SELECT USING (true);
+CREATE POLICY "Allow public read access to members" ON members FOR SELECT USING (true);
 CREATE POLICY "Allow public read access to meetings" ON meetings FOR SELECT USING (true);
 CREATE POLICY "Allow public read access to agenda_items" ON agenda_items FOR SELECT USING (true);
 CREATE POLICY "Allow public read access to votes" ON votes FOR SELECT USING (true);